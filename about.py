@@ -0,0 +1,158 @@
+import streamlit as st
+from config import PublicConfig
+from templates import max_len_display, minify_html, pretty_lang_pair
+
+ABOUT_HEADER_HTML = minify_html("""
+<div class="page-hero">
+    <h1>Historical Turkish Translation</h1>
+    <p>Bridging centuries of Turkish linguistic evolution with cutting-edge AI technology</p>
+    <div class="page-hero__rule"></div>
+</div>
+""")
+
+ABOUT_OVERVIEW_HTML = minify_html("""
+<div class="card-panel" style="margin-bottom: 2rem;">
+    <h2 class="card-panel__title card-panel__title--primary" style="font-size: 1.8rem;">🌟 Project Overview</h2>
+    <p class="card-panel__text" style="font-size: 1.1rem; margin-bottom: 1.5rem;">
+        This translation system represents a breakthrough in computational linguistics for historical Turkish texts. 
+        Developed by the BUCOLIN lab at Boğaziçi University, it enables seamless translation between Ottoman Turkish 
+        and Modern Turkish, making centuries of historical documents accessible to contemporary readers and researchers.
+    </p>
+</div>
+""")
+
+ABOUT_FEATURES_HTML = minify_html("""
+<div class="card-panel">
+    <h3 class="card-panel__title">🚀 Key Features</h3>
+    <div class="feature-list">
+        <div class="feature-row" style="--feature-accent: var(--accent-primary);">
+            <span class="feature-row__icon">🎯</span>
+            <div>
+                <strong>Historical Accuracy:</strong>
+                <span>Trained on authentic texts from 15th-20th centuries</span>
+            </div>
+        </div>
+        <div class="feature-row" style="--feature-accent: var(--accent-tertiary);">
+            <span class="feature-row__icon">🔬</span>
+            <div>
+                <strong>Linguistic Precision:</strong>
+                <span>Preserves semantic meaning across temporal variations</span>
+            </div>
+        </div>
+        <div class="feature-row" style="--feature-accent: var(--accent-secondary);">
+            <span class="feature-row__icon">🎓</span>
+            <div>
+                <strong>Academic Grade:</strong>
+                <span>Suitable for scholarly research and educational purposes</span>
+            </div>
+        </div>
+        <div class="feature-row" style="--feature-accent: var(--accent-primary);">
+            <span class="feature-row__icon">⚡</span>
+            <div>
+                <strong>Real-time Processing:</strong>
+                <span>Instant translation with confidence metrics</span>
+            </div>
+        </div>
+    </div>
+</div>
+""")
+
+TECH_SPEC_TEMPLATE = minify_html("""
+<div class="gradient-swatch gradient-swatch--tech">
+    <h3>⚙️ Technical Specifications</h3>
+    <div>
+        <div class="spec-item">
+            <strong>Model Type:</strong><br>
+            <span>Transformer-based</span>
+        </div>
+        <div class="spec-item">
+            <strong>Training Data:</strong><br>
+            <span>Ottoman Text Corpus</span>
+        </div>
+        <div class="spec-item">
+            <strong>Coverage:</strong><br>
+            <span>15th-20th centuries</span>
+        </div>
+        <div class="spec-item">
+            <strong>Languages:</strong><br>
+            <span>{source_language} ↔ {target_language}</span>
+        </div>
+        <div class="spec-item">
+            <strong>Version:</strong><br>
+            <span>{version}</span>
+        </div>
+        <div class="spec-item">
+            <strong>Max Text Length:</strong><br>
+            <span>{max_length} characters</span>
+        </div>
+    </div>
+</div>
+""")
+
+TECH_SPEC_HTML = TECH_SPEC_TEMPLATE.format(
+    source_language=pretty_lang_pair()[0],
+    target_language=pretty_lang_pair()[1],
+    version=PublicConfig.APP_VERSION,
+    max_length=max_len_display()
+)
+
+ABOUT_CAPABILITIES_TITLE_HTML = minify_html("""
+<h2 style="text-align: center; color: var(--accent-primary); font-family: 'Crimson Text', serif; 
+           font-size: 2.2rem; margin: 3rem 0 2rem 0;">✨ Core Capabilities</h2>
+""")
+
+ABOUT_HISTORICAL_CARD_HTML = minify_html("""
+<div class="capability-card capability-card--primary">
+    <div style="font-size: 3.5rem; margin-bottom: 1.5rem; color: var(--accent-primary);">📜</div>
+    <h3 style="color: var(--accent-primary); margin-bottom: 1rem; font-family: 'Crimson Text', serif; font-size: 1.3rem;">Historical Texts</h3>
+    <p style="color: var(--text-secondary); line-height: 1.6;">Process manuscripts, documents, and literature from the Ottoman period with unprecedented accuracy and cultural sensitivity.</p>
+</div>
+""")
+
+ABOUT_AI_CARD_HTML = minify_html("""
+<div class="capability-card capability-card--secondary">
+    <div style="font-size: 3.5rem; margin-bottom: 1.5rem; color: var(--accent-tertiary);">🧠</div>
+    <h3 style="color: var(--accent-tertiary); margin-bottom: 1rem; font-family: 'Crimson Text', serif; font-size: 1.3rem;">AI-Powered</h3>
+    <p style="color: var(--text-secondary); line-height: 1.6;">Advanced neural networks specifically trained and fine-tuned for the nuances of historical Turkish language variations.</p>
+</div>
+""")
+
+ABOUT_ACADEMIC_CARD_HTML = minify_html("""
+<div class="capability-card capability-card--tertiary">
+    <div style="font-size: 3.5rem; margin-bottom: 1.5rem; color: var(--accent-secondary);">🎓</div>
+    <h3 style="color: var(--accent-secondary); margin-bottom: 1rem; font-family: 'Crimson Text', serif; font-size: 1.3rem;">Academic Research</h3>
+    <p style="color: var(--text-secondary); line-height: 1.6;">Developed by computational linguistics experts at Boğaziçi University with rigorous academic standards and peer review.</p>
+</div>
+""")
+
+def render():
+    """About page with project information"""
+    st.html(ABOUT_HEADER_HTML)
+    st.html(ABOUT_OVERVIEW_HTML)
+    
+    # The rest of the page is only built and sent once the reader opens it
+    if not st.toggle("Explore features & technical details", key="about_details"):
+        return
+    
+    col1, col2 = st.columns([2, 1], gap="large")
+    
+    with col1:
+        st.html(ABOUT_FEATURES_HTML)
+    
+    with col2:
+        st.html(TECH_SPEC_HTML)
+    
+    # Enhanced Feature cards
+    st.markdown("---")
+    st.html(ABOUT_CAPABILITIES_TITLE_HTML)
+    
+    col1, col2, col3 = st.columns(3, gap="large")
+    
+    with col1:
+        st.html(ABOUT_HISTORICAL_CARD_HTML)
+    
+    with col2:
+        st.html(ABOUT_AI_CARD_HTML)
+    
+    with col3:
+        st.html(ABOUT_ACADEMIC_CARD_HTML)
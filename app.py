@@ -1,97 +1,244 @@
 import streamlit as st
-import requests
 import json
+import re
 import time
-from typing import Dict, Any
-from urllib.parse import parse_qs
+import threading
+import importlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Dict, Any, List, Optional, Tuple
 
-# Import secure configuration and admin system
+# Import secure configuration (the admin gate and info pages are imported on their routes only)
 from config import PublicConfig, SecureConfig
-from admin import admin_required
+# Static page HTML, built once per process rather than on every rerun
+from templates import (
+    ADMIN_HEADER_TEMPLATE,
+    ANALYSIS_TITLE_HTML,
+    FOOTER_HTML,
+    HEADER_HTML,
+    NAV_BRAND_HTML,
+    NAV_ICON_HTML,
+    OUTPUT_PLACEHOLDER_HTML,
+    SOURCE_HEADER_HTML,
+    TRANSLATION_HEADER_HTML,
+    max_len_display,
+)
 
 class MockTranslationService:
     """Mock translation service for development/demo purposes"""
     
+    # Built once at import instead of on every translate call
+    _MOCK = {
+        "merhaba": "hello",
+        "selam": "greetings", 
+        "kitap": "book",
+        "ev": "house",
+        "su": "water",
+        "yemek": "food",
+        "güzel": "beautiful",
+        "büyük": "big",
+        "küçük": "small"
+    }
+    
     def translate(self, text: str) -> Dict[str, Any]:
-        time.sleep(PublicConfig.MOCK_PROCESSING_TIME)
-        
-        mock_translations = {
-            "merhaba": "hello",
-            "selam": "greetings", 
-            "kitap": "book",
-            "ev": "house",
-            "su": "water",
-            "yemek": "food",
-            "güzel": "beautiful",
-            "büyük": "big",
-            "küçük": "small"
-        }
-        
-        words = text.lower().split()
-        translated_words = []
-        confidence_scores = []
+        start_time = time.perf_counter()
+        if PublicConfig.MOCK_SIMULATE_LATENCY and PublicConfig.MOCK_PROCESSING_TIME > 0:
+            time.sleep(PublicConfig.MOCK_PROCESSING_TIME)
+        
+        words = text.split()
+        mock = self._MOCK
+        
+        # Single-word lookups are the common demo case: skip the loop entirely
+        if len(words) == 1:
+            translated = mock.get(words[0].lower())
+            return {
+                "success": True,
+                "original_text": text,
+                "translated_text": translated if translated is not None else "[" + words[0] + "]",
+                "confidence": PublicConfig.MOCK_CONFIDENCE_THRESHOLD + 0.2 if translated is not None else 0.3,
+                "processing_time": time.perf_counter() - start_time,
+                "word_count": 1,
+                "recognized_words": 1 if translated is not None else 0
+            }
+        
+        parts = []
+        append = parts.append
+        recognized = 0
         
         for word in words:
-            if word in mock_translations:
-                translated_words.append(mock_translations[word])
-                confidence_scores.append(PublicConfig.MOCK_CONFIDENCE_THRESHOLD + 0.2)
+            translated = mock.get(word.lower())
+            if translated is not None:
+                append(translated)
+                recognized += 1
             else:
-                translated_words.append(f"[{word}]")
-                confidence_scores.append(0.3)
+                # Keep the user's original casing for unrecognized words
+                append("[" + word + "]")
         
-        avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0
-        translation = " ".join(translated_words)
+        # Every word scores one of two values, so the mean follows from the recognized count
+        known_confidence = PublicConfig.MOCK_CONFIDENCE_THRESHOLD + 0.2
+        avg_confidence = (recognized * known_confidence + (len(words) - recognized) * 0.3) / len(words) if words else 0
+        translation = " ".join(parts)
         
         return {
             "success": True,
             "original_text": text,
             "translated_text": translation,
             "confidence": avg_confidence,
-            "processing_time": PublicConfig.MOCK_PROCESSING_TIME,
+            "processing_time": time.perf_counter() - start_time,
             "word_count": len(words),
-            "recognized_words": len([w for w in words if w in mock_translations])
+            "recognized_words": recognized
         }
 
+# Captures the whitespace after each sentence so chunking keeps line and paragraph breaks
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])(\s+)')
+_WHITESPACE = re.compile(r'\s+')
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+
+def _orjson():
+    """orjson module if installed, else None; imported on the first API call, then served from sys.modules"""
+    try:
+        import orjson
+    except ImportError:  # fall back to the stdlib parser
+        return None
+    return orjson
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a request body, preferring orjson when installed"""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+def _loads(data: bytes) -> Any:
+    """Parse a response body, preferring orjson when installed"""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class APITranslationService:
     """Production API translation service"""
     
     def __init__(self):
-        self.api_endpoint = SecureConfig.get_api_endpoint()
+        # Imported here so mock-only sessions never load the HTTP stack
+        import requests
+        from urllib3.util.retry import Retry
+        
         self.timeout = 30
         self.max_retries = 3
+        
+        # Reuse keep-alive connections; urllib3 handles retries with backoff
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=1,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["POST"],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self.session = requests.Session()
+        # Keep at least one pooled connection per chunk worker so concurrent chunks never open throwaway sockets
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(10, PublicConfig.API_MAX_WORKERS),
+            max_retries=retry
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+    
+    @cached_property
+    def api_endpoint(self) -> str:
+        """Endpoint URL, read from config on first use"""
+        return SecureConfig.get_api_endpoint()
     
     def translate(self, text: str) -> Dict[str, Any]:
+        if len(text) <= PublicConfig.API_CHUNK_THRESHOLD:
+            return self._translate_one(text)
+        
+        # Long inputs: send sentence-aligned chunks concurrently over the shared pool
+        start_time = time.perf_counter()
+        chunks, joins = self._split_chunks(text)
+        with ThreadPoolExecutor(max_workers=PublicConfig.API_MAX_WORKERS) as executor:
+            results = list(executor.map(self._translate_one, chunks))
+        
+        for result in results:
+            if not result.get("success"):
+                result["processing_time"] = time.perf_counter() - start_time
+                return result
+        
+        merged = {
+            "success": True,
+            "original_text": text,
+            "translated_text": results[0].get("translated_text", "") + "".join(
+                join + r.get("translated_text", "") for join, r in zip(joins, results[1:])
+            ),
+            "processing_time": time.perf_counter() - start_time
+        }
+        if all("confidence" in r for r in results):
+            merged["confidence"] = sum(r["confidence"] * len(c) for r, c in zip(results, chunks)) / sum(len(c) for c in chunks)
+        for key in ("word_count", "recognized_words"):
+            if all(key in r for r in results):
+                merged[key] = sum(r[key] for r in results)
+        return merged
+    
+    @staticmethod
+    def _split_chunks(text: str) -> Tuple[List[str], List[str]]:
+        """Group sentences into chunks of at most API_CHUNK_THRESHOLD characters,
+        returning the chunks and the original whitespace between consecutive chunks"""
+        parts = _SENTENCE_BOUNDARY.split(text.strip())
+        chunks, joins = [], []
+        current = parts[0]
+        for i in range(1, len(parts), 2):
+            separator, sentence = parts[i], parts[i + 1]
+            if len(current) + len(separator) + len(sentence) > PublicConfig.API_CHUNK_THRESHOLD:
+                chunks.append(current)
+                joins.append(separator)
+                current = sentence
+            else:
+                current += separator + sentence
+        chunks.append(current)
+        return chunks, joins
+    
+    def _translate_one(self, text: str) -> Dict[str, Any]:
+        import requests
+        
         payload = {"text": text}
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        for attempt in range(self.max_retries):
+        try:
+            response = self.session.post(
+                self.api_endpoint,
+                data=_dumps(payload),
+                timeout=self.timeout
+            )
+        except requests.exceptions.RequestException:
+            return {
+                "success": False,
+                "error": "Cannot connect to translation service",
+                "processing_time": time.perf_counter() - start_time
+            }
+        
+        if response.status_code == 200:
+            # A proxy or gateway page can come back as 200 with a non-JSON body; both
+            # json's and orjson's decode errors are ValueError subclasses
             try:
-                response = requests.post(
-                    self.api_endpoint,
-                    json=payload,
-                    timeout=self.timeout,
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    result["processing_time"] = time.time() - start_time
-                    return result
-                else:
-                    return {
-                        "success": False,
-                        "error": "Translation service is currently unavailable",
-                        "processing_time": time.time() - start_time
-                    }
-                    
-            except requests.exceptions.RequestException:
-                if attempt == self.max_retries - 1:
-                    return {
-                        "success": False,
-                        "error": "Cannot connect to translation service",
-                        "processing_time": time.time() - start_time
-                    }
-                time.sleep(2 ** attempt)
+                result = _loads(response.content)
+            except ValueError:
+                return {
+                    "success": False,
+                    "error": "Cannot connect to translation service",
+                    "processing_time": time.perf_counter() - start_time
+                }
+            result["processing_time"] = time.perf_counter() - start_time
+            return result
+        
+        return {
+            "success": False,
+            "error": "Translation service is currently unavailable",
+            "processing_time": time.perf_counter() - start_time
+        }
 
 class TurkishTranslator:
     """Main translator class that handles service selection"""
@@ -103,18 +250,64 @@ class TurkishTranslator:
         else:
             self.service = APITranslationService()
             self.service_name = "AI Model (Production)"
+        
+        # LRU cache of successful results, keyed on stripped input text; values are (stored_at, result)
+        self._cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
     
-    def translate_text(self, text: str) -> Dict[str, Any]:
-        if not text.strip():
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+    
+    @staticmethod
+    def validate(text: str) -> Optional[Dict[str, Any]]:
+        """Error result for empty or over-long (already stripped) text, else None"""
+        if not text:
             return {"success": False, "error": "Please enter some text to translate"}
         
         if len(text) > PublicConfig.MAX_TEXT_LENGTH:
             return {"success": False, "error": f"Text too long. Maximum {PublicConfig.MAX_TEXT_LENGTH} characters allowed."}
-        
-        result = self.service.translate(text)
+        return None
+    
+    def translate_text(self, text: str) -> Dict[str, Any]:
+        # Normalize once: the stripped text is validated, translated and used as the cache key
+        key = text.strip()
+        error = self.validate(key)
+        if error is not None:
+            return error
+        
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                stored_at, cached_result = cached
+                if time.monotonic() - stored_at < PublicConfig.TRANSLATION_CACHE_TTL:
+                    self._cache.move_to_end(key)
+                    return dict(cached_result)
+                del self._cache[key]
+        
+        result = self.service.translate(key)
         result["service_used"] = self.service_name
+        
+        if result.get("success"):
+            # Derived stats are computed once here rather than on every rerun
+            word_count = result.get("word_count", 0)
+            if "recognized_words" in result:
+                result["recognition_rate"] = result["recognized_words"] / word_count if word_count else 0.0
+            result["source_length"] = len(result.get("original_text", ""))
+            result["translation_length"] = len(result.get("translated_text", ""))
+            
+            # Only cache successes so transient API failures can be retried
+            with self._cache_lock:
+                self._cache[key] = (time.monotonic(), dict(result))
+                if len(self._cache) > PublicConfig.TRANSLATION_CACHE_SIZE:
+                    self._cache.popitem(last=False)
         return result
 
+@st.cache_resource
+def get_translator() -> TurkishTranslator:
+    """Shared translator instance that survives Streamlit reruns"""
+    return TurkishTranslator()
+
 def get_theme_colors(theme='light'):
     """Get color variables for the selected theme"""
     if theme == 'dark':
@@ -187,6 +380,19 @@ def get_theme_colors(theme='light'):
         --overlay-highlight-lg: rgba(138, 173, 204, 0.42);
         --overlay-white-sm: rgba(255, 255, 255, 0.08);
         --overlay-white-md: rgba(255, 255, 255, 0.15);
+        
+        /* Gradient Swatches - sidebar cards on the about and research pages */
+        --swatch-tech: linear-gradient(135deg, var(--accent-secondary) 0%, var(--accent-primary) 100%);
+        --swatch-areas: linear-gradient(135deg, var(--accent-secondary) 0%, var(--accent-primary) 100%);
+        --swatch-datasets: linear-gradient(135deg, var(--accent-tertiary) 0%, var(--accent-primary) 100%);
+        --swatch-tech-border: none;
+        --swatch-areas-border: none;
+        --swatch-datasets-border: none;
+        --swatch-shadow: 0 6px 16px var(--overlay-tertiary-2xl);
+        --swatch-datasets-shadow: 0 6px 16px var(--overlay-secondary-xl);
+        --swatch-ink: #ffffff;
+        --swatch-heading: #ffffff;
+        --swatch-body: #e8ecf1;
         """
     else:  # light theme 
         return """
@@ -258,754 +464,259 @@ def get_theme_colors(theme='light'):
         --overlay-highlight-lg: rgba(45, 79, 122, 0.30);
         --overlay-white-sm: rgba(255, 255, 255, 0.6);
         --overlay-white-md: rgba(255, 255, 255, 0.9);
+        
+        /* Gradient Swatches - sidebar cards on the about and research pages */
+        --swatch-tech: linear-gradient(135deg, #d0e1f0 0%, #c2d7ed 100%);
+        --swatch-areas: linear-gradient(135deg, #d4e3f0 0%, #c5d9ed 100%);
+        --swatch-datasets: linear-gradient(135deg, #dde8f2 0%, #c9daf0 100%);
+        --swatch-tech-border: 1px solid #b5cde6;
+        --swatch-areas-border: 1px solid #b8cfe6;
+        --swatch-datasets-border: 1px solid #bdd2ea;
+        --swatch-shadow: 0 6px 16px var(--shadow-md);
+        --swatch-datasets-shadow: 0 6px 16px var(--shadow-md);
+        --swatch-ink: #0a1929;
+        --swatch-heading: #1e3a5f;
+        --swatch-body: #2d4f7a;
         """
      
-def apply_custom_styles():
-    """Apply beautiful, modern custom CSS styles to the application"""
-    # Get theme from session state (default to LIGHT now)
-    theme = st.session_state.get('theme', 'light')
-    theme_colors = get_theme_colors(theme)
-    
-    st.markdown(f"""
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=Crimson+Text:ital,wght@0,400;0,600;1,400&display=swap');
-    
-    :root {{
-        {theme_colors}
-    }}
-    
-    .stApp {{
-        background: linear-gradient(135deg, var(--bg-primary) 0%, var(--bg-secondary) 100%);
-        color: var(--text-primary);
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-        transition: background 0.3s ease, color 0.3s ease;
-    }}
-    
-    /* Add subtle pattern overlay */
-    .stApp::before {{
-        content: '';
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background-image: 
-            radial-gradient(circle at 1px 1px, var(--overlay-primary-xs) 1px, transparent 0);
-        background-size: 40px 40px;
-        pointer-events: none;
-        z-index: -1;
-    }}
-    
-    .nav-container {{
-        background: linear-gradient(135deg, var(--bg-tertiary) 0%, var(--bg-secondary) 100%);
-        backdrop-filter: blur(30px);
-        padding: 1rem 2rem;
-        border-radius: 30px;
-        margin-bottom: 2rem;
-        border: 2px solid var(--overlay-primary-lg);
-        box-shadow: 0 8px 32px var(--shadow-lg), inset 0 1px 0 var(--overlay-white-sm);
-        position: relative;
-        overflow: hidden;
-        transition: all 0.3s ease;
-    }}
+# Served by Streamlit's static file route (see .streamlit/config.toml) so browsers cache it;
+# the version query string busts that cache on each release. Needs the Streamlit floor in
+# requirements.txt: older static handlers send .css as text/plain with nosniff, so it never applies
+STYLESHEET_URL = f"app/static/styles.css?v={PublicConfig.APP_VERSION}"
+FONTS_URL = "https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=Crimson+Text:ital,wght@0,400;0,600;1,400&display=swap"
 
-    .nav-container::before {{
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 3px;
-        background: linear-gradient(90deg, transparent, var(--accent-primary), var(--accent-tertiary), var(--accent-secondary), transparent);
-    }}
-
-    .nav-container::after {{
-        content: '';
-        position: absolute;
-        top: 0;
-        right: 0;
-        width: 200px;
-        height: 200px;
-        background: radial-gradient(circle, var(--overlay-primary-md) 0%, transparent 70%);
-        border-radius: 50%;
-        transform: translate(50%, -50%);
-        pointer-events: none;
-    }}
-    
-    .bucolin-brand {{
-        color: var(--accent-primary);
-        font-size: 1.4rem;
-        font-weight: 700;
-        text-align: center;
-        margin-bottom: 1rem;
-        font-family: 'Crimson Text', serif;
-        letter-spacing: 4px;
-        text-transform: uppercase;
-        position: relative;
-        display: inline-block;
-        width: 100%;
-    }}
+@st.cache_resource
+def _load_css(theme: str) -> str:
+    """Stylesheet links plus an inline block with the theme's color variables"""
+    return (
+        '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+        f'<link rel="stylesheet" href="{FONTS_URL}">'
+        f'<link rel="stylesheet" href="{STYLESHEET_URL}">'
+        f"<style>:root{{{_WHITESPACE.sub(' ', _CSS_COMMENT.sub('', get_theme_colors(theme))).strip()}}}</style>"
+    )
 
-    .bucolin-brand::after {{
-        content: '';
-        position: absolute;
-        bottom: -8px;
-        left: 50%;
-        transform: translateX(-50%);
-        width: 60px;
-        height: 2px;
-        background: linear-gradient(90deg, transparent, var(--accent-primary), transparent);
-    }}
-    
-    .main-header {{
-        text-align: center;
-        background: linear-gradient(135deg, var(--bg-tertiary) 0%, var(--bg-secondary) 100%);
-        padding: 3rem 2rem;
-        border-radius: 20px;
-        color: var(--text-primary);
-        margin-bottom: 3rem;
-        box-shadow: 
-            0 16px 40px var(--shadow-md),
-            inset 0 1px 0 var(--overlay-white-sm);
-        border: 1px solid var(--border-primary);
-        position: relative;
-        overflow: hidden;
-        transition: all 0.3s ease;
-    }}
-    
-    .main-header::before {{
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(
-            135deg,
-            var(--overlay-primary-sm) 0%,
-            var(--overlay-secondary-sm) 50%,
-            var(--overlay-tertiary-sm) 100%
-        );
-        pointer-events: none;
-    }}
-    
-    .main-header h1 {{
-        position: relative;
-        z-index: 1;
-        font-family: 'Crimson Text', serif !important;
-        font-weight: 700;
-        font-size: 2.8rem;
-        margin: 0;
-        color: var(--text-primary) !important;
-        text-shadow: 0 4px 8px var(--shadow-sm);
-    }}
-    
-    .translation-container {{
-        background: linear-gradient(135deg, var(--bg-tertiary) 0%, var(--bg-secondary) 100%);
-        backdrop-filter: blur(20px);
-        padding: 2.5rem;
-        border-radius: 16px;
-        border: 1px solid var(--border-primary);
-        box-shadow: 0 12px 32px var(--shadow-md);
-        position: relative;
-        overflow: hidden;
-        transition: all 0.3s ease;
-    }}
-    
-    .translation-container:hover {{
-        transform: translateY(-2px);
-        box-shadow: 0 16px 40px var(--shadow-md);
-    }}
-    
-    .translation-container::before {{
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 1px;
-        background: linear-gradient(90deg, transparent, var(--accent-primary), transparent);
-    }}
-    
-    .section-header {{
-        color: var(--accent-primary);
-        font-size: 1.1rem;
-        font-weight: 600;
-        margin-bottom: 1.8rem;
-        padding-bottom: 0.8rem;
-        border-bottom: 2px solid var(--accent-secondary);
-        text-transform: uppercase;
-        letter-spacing: 3px;
-        font-family: 'Inter', sans-serif;
-        position: relative;
-    }}
-    
-    .section-header::after {{
-        content: '';
-        position: absolute;
-        bottom: -2px;
-        left: 0;
-        width: 60px;
-        height: 2px;
-        background: var(--accent-primary);
-    }}
-    
-    .stats-grid {{
-        background: linear-gradient(135deg, var(--bg-tertiary) 0%, var(--bg-secondary) 100%);
-        backdrop-filter: blur(20px);
-        padding: 2.5rem;
-        border-radius: 20px;
-        margin: 3rem 0;
-        border: 1px solid var(--border-primary);
-        box-shadow: 0 16px 40px var(--shadow-md);
-        position: relative;
-        overflow: hidden;
-        transition: all 0.3s ease;
-    }}
-    
-    .stats-grid::before {{
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 3px;
-        background: linear-gradient(90deg, var(--accent-primary), var(--accent-tertiary), var(--accent-secondary));
-    }}
-    
-    .metric-card {{
-        background: linear-gradient(135deg, var(--bg-secondary) 0%, var(--bg-primary) 100%);
-        padding: 2rem 1.5rem;
-        border-radius: 12px;
-        text-align: center;
-        border: 1px solid var(--border-primary);
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        box-shadow: 0 4px 16px var(--shadow-sm);
-        position: relative;
-        overflow: hidden;
-        backdrop-filter: blur(10px);
-    }}
-    
-    .metric-card::before {{
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, var(--overlay-primary-md), transparent);
-        transition: left 0.5s ease;
-    }}
-    
-    .metric-card:hover::before {{
-        left: 100%;
-    }}
-    
-    .metric-card:hover {{
-        transform: translateY(-8px) scale(1.02);
-        box-shadow: 0 16px 40px var(--overlay-primary-lg);
-        border-color: var(--accent-primary);
-    }}
-    
-    .metric-value {{
-        font-size: 2.2rem;
-        font-weight: 700;
-        color: var(--accent-primary);
-        margin: 1rem 0;
-        font-family: 'Inter', sans-serif;
-        text-shadow: 0 2px 8px var(--overlay-primary-xl);
-    }}
-    
-    .metric-label {{
-        color: var(--text-secondary);
-        font-size: 0.85rem;
-        font-weight: 500;
-        text-transform: uppercase;
-        letter-spacing: 1.5px;
-        opacity: 0.9;
-    }}
-    
-    .stTextArea > div > div > textarea {{
-        background: linear-gradient(135deg, var(--bg-primary) 0%, var(--bg-secondary) 100%) !important;
-        color: var(--text-primary) !important;
-        border: 1px solid var(--border-primary) !important;
-        border-radius: 12px !important;
-        font-size: 1.05rem !important;
-        line-height: 1.7 !important;
-        font-family: 'Crimson Text', serif !important;
-        padding: 1.2rem !important;
-        transition: all 0.3s ease !important;
-        backdrop-filter: blur(10px) !important;
-    }}
-    
-    .stTextArea > div > div > textarea:focus {{
-        border-color: var(--accent-primary) !important;
-        box-shadow: 0 0 0 3px var(--overlay-primary-lg), 0 8px 25px var(--shadow-sm) !important;
-        transform: translateY(-1px) !important;
-    }}
-    
-    .stTextArea > div > div > textarea::placeholder {{
-        color: var(--text-muted) !important;
-        font-style: italic !important;
-    }}
-    
-    .stButton > button {{
-        background: linear-gradient(135deg, var(--accent-secondary) 0%, var(--accent-primary) 100%) !important;
-        color: #ffffff !important;  /* FORCE WHITE for all buttons on gradient backgrounds */
-        border: none !important;
-        border-radius: 12px !important;
-        padding: 1rem 2.5rem !important;
-        font-weight: 600 !important;
-        font-size: 1.05rem !important;
-        text-transform: uppercase !important;
-        letter-spacing: 1.5px !important;
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1) !important;
-        box-shadow: 0 8px 25px var(--overlay-tertiary-3xl) !important;
-        font-family: 'Inter', sans-serif !important;
-        position: relative !important;
-        overflow: hidden !important;
-    }}
-    
-    .stButton > button::before {{
-        content: '' !important;
-        position: absolute !important;
-        top: 0 !important;
-        left: -100% !important;
-        width: 100% !important;
-        height: 100% !important;
-        background: linear-gradient(90deg, transparent, var(--overlay-white-md), transparent) !important;
-        transition: left 0.5s ease !important;
-    }}
-    
-    .stButton > button:hover::before {{
-        left: 100% !important;
-    }}
-    
-    .stButton > button:hover {{
-        background: linear-gradient(135deg, var(--accent-primary) 0%, var(--accent-tertiary) 100%) !important;
-        transform: translateY(-3px) scale(1.02) !important;
-        box-shadow: 0 12px 35px var(--overlay-primary-2xl) !important;
-    }}
-    
-    .success-message {{
-        background: linear-gradient(135deg, var(--overlay-tertiary-lg), var(--overlay-tertiary-md));
-        color: var(--status-success);
-        padding: 1.2rem 1.5rem;
-        border-radius: 12px;
-        margin: 1.5rem 0;
-        font-weight: 500;
-        border: 1px solid var(--overlay-tertiary-xl);
-        backdrop-filter: blur(10px);
-        box-shadow: 0 4px 16px var(--overlay-tertiary-lg);
-    }}
-    
-    .error-message {{
-        background: linear-gradient(135deg, var(--overlay-secondary-lg), var(--overlay-secondary-sm));
-        color: var(--status-error);
-        padding: 1.2rem 1.5rem;
-        border-radius: 12px;
-        margin: 1.5rem 0;
-        font-weight: 500;
-        border: 1px solid var(--overlay-secondary-lg);
-        backdrop-filter: blur(10px);
-        box-shadow: 0 4px 16px var(--overlay-secondary-xl);
-    }}
-    
-    .details-section {{
-        background: linear-gradient(135deg, var(--bg-secondary) 0%, var(--bg-primary) 100%);
-        padding: 2rem;
-        border-radius: 12px;
-        border: 1px solid var(--border-primary);
-        margin-top: 1.5rem;
-        backdrop-filter: blur(10px);
-        transition: all 0.3s ease;
-    }}
-    
-    /* Translate button / Primary button special styling */
-    .stButton[data-testid="baseButton-primary"] > button {{
-        background: linear-gradient(135deg, var(--interactive-primary) 0%, var(--interactive-primary-hover) 50%, var(--interactive-primary-active) 100%) !important;
-        color: #ffffff !important;  /* WHITE text on navy */
-        border: none !important;
-        border-radius: 12px !important;
-        padding: 1rem 2.5rem !important;
-        font-weight: 600 !important;
-        font-size: 1.1rem !important;
-        text-transform: uppercase !important;
-        letter-spacing: 1.5px !important;
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1) !important;
-        box-shadow: 0 8px 25px var(--overlay-highlight-md) !important;
-        font-family: 'Inter', sans-serif !important;
-        position: relative !important;
-        overflow: hidden !important;
-    }}
-    
-    .stButton[data-testid="baseButton-primary"] > button:hover {{
-        background: linear-gradient(135deg, var(--interactive-secondary) 0%, var(--interactive-secondary-hover) 50%, var(--interactive-secondary-active) 100%) !important;
-        transform: translateY(-3px) scale(1.02) !important;
-        box-shadow: 0 12px 35px var(--overlay-highlight-lg) !important;
-        color: #ffffff !important;  /* Keep white on hover */
-    }}
-    
-    /* Secondary button styling for navigation */
-    .stButton[data-testid="baseButton-secondary"] > button {{
-        background: linear-gradient(135deg, var(--bg-tertiary) 0%, var(--bg-elevated) 100%) !important;
-        color: var(--text-secondary) !important;
-        border: 1px solid var(--border-primary) !important;
-        border-radius: 12px !important;
-        padding: 1rem 2.5rem !important;
-        font-weight: 600 !important;
-        font-size: 1.05rem !important;
-        text-transform: uppercase !important;
-        letter-spacing: 1.5px !important;
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1) !important;
-        box-shadow: 0 4px 12px var(--shadow-sm) !important;
-        font-family: 'Inter', sans-serif !important;
-        position: relative !important;
-        overflow: hidden !important;
-    }}
-    
-    .stButton[data-testid="baseButton-secondary"] > button::before {{
-        content: '' !important;
-        position: absolute !important;
-        top: 0 !important;
-        left: -100% !important;
-        width: 100% !important;
-        height: 100% !important;
-        background: linear-gradient(90deg, transparent, var(--overlay-primary-sm), transparent) !important;
-        transition: left 0.5s ease !important;
-    }}
-    
-    .stButton[data-testid="baseButton-secondary"] > button:hover::before {{
-        left: 100% !important;
-    }}
-    
-    .stButton[data-testid="baseButton-secondary"] > button:hover {{
-        background: linear-gradient(135deg, var(--bg-elevated) 0%, var(--bg-tertiary) 100%) !important;
-        color: var(--text-primary) !important;
-        border-color: var(--accent-primary) !important;
-        transform: translateY(-2px) scale(1.02) !important;
-        box-shadow: 0 8px 20px var(--shadow-md) !important;
-    }}
-    
-    /* Character counter styling */
-    .stCaption {{
-        color: var(--text-muted) !important;
-        font-size: 0.85rem !important;
-        margin-top: 0.5rem !important;
-    }}
-    
-    /* Expander styling */
-    .streamlit-expanderHeader {{
-        background: linear-gradient(135deg, var(--bg-tertiary) 0%, var(--bg-secondary) 100%) !important;
-        border-radius: 8px !important;
-        border: 1px solid var(--border-primary) !important;
-        transition: all 0.3s ease !important;
-    }}
-    
-    /* Link button styling */
-    .stLinkButton > a {{
-        background: linear-gradient(135deg, var(--accent-tertiary) 0%, var(--accent-primary) 100%) !important;
-        color: #ffffff !important;
-        text-decoration: none !important;
-        border-radius: 12px !important;
-        padding: 0.8rem 1.5rem !important;
-        font-weight: 500 !important;
-        transition: all 0.3s ease !important;
-        border: 1px solid transparent !important;
-    }}
-    
-    .stLinkButton > a:hover {{
-        transform: translateY(-2px) !important;
-        box-shadow: 0 8px 25px var(--overlay-secondary-xl) !important;
-    }}
-    
-    /* Animation for loading */
-    @keyframes shimmer {{
-        0% {{ background-position: -1000px 0; }}
-        100% {{ background-position: 1000px 0; }}
-    }}
-    
-    .loading-shimmer {{
-        background: linear-gradient(90deg, transparent, var(--overlay-primary-md), transparent);
-        background-size: 1000px 100%;
-        animation: shimmer 2s infinite;
-    }}
-    
-    /* Scrollbar styling */
-    ::-webkit-scrollbar {{
-        width: 8px;
-    }}
-    
-    ::-webkit-scrollbar-track {{
-        background: var(--bg-primary);
-    }}
-    
-    ::-webkit-scrollbar-thumb {{
-        background: linear-gradient(135deg, var(--accent-primary), var(--accent-tertiary));
-        border-radius: 4px;
-    }}
-    
-    ::-webkit-scrollbar-thumb:hover {{
-        background: linear-gradient(135deg, var(--accent-tertiary), var(--accent-secondary));
-    }}
+def apply_custom_styles(theme: str = None):
+    """Apply beautiful, modern custom CSS styles to the application"""
+    # Get theme from session state unless the caller already read it (default to LIGHT now)
+    if theme is None:
+        theme = st.session_state.get('theme', 'light')
+    st.markdown(_load_css(theme), unsafe_allow_html=True)
 
-    /* Responsive Navigation for Small Screens */
-    @media (max-width: 1200px) {{
-        .stButton > button,
-        .stButton[data-testid="baseButton-secondary"] > button,
-        .stButton[data-testid="baseButton-primary"] > button {{
-            font-size: 0.9rem !important;
-            letter-spacing: 1px !important;
-            padding: 0.8rem 1.5rem !important;
-        }}
-    }}
+# current theme -> (icon, help text, theme to switch to) for the nav theme button
+_THEME_SWITCH = {
+    "dark": ("☀️", "Switch to Light Mode", "light"),
+    "light": ("🌙", "Switch to Dark Mode", "dark")
+}
 
-    @media (max-width: 992px) {{
-        .stButton > button,
-        .stButton[data-testid="baseButton-secondary"] > button,
-        .stButton[data-testid="baseButton-primary"] > button {{
-            font-size: 0.85rem !important;
-            letter-spacing: 0.5px !important;
-            padding: 0.7rem 1rem !important;
-        }}
-        
-        .bucolin-brand {{
-            font-size: 1.2rem !important;
-            letter-spacing: 3px !important;
-        }}
-    }}
+def _set_theme(theme: str):
+    """Button callback: switch theme before the rerun renders the page"""
+    st.session_state.theme = theme
 
-    @media (max-width: 768px) {{
-        .stButton > button,
-        .stButton[data-testid="baseButton-secondary"] > button,
-        .stButton[data-testid="baseButton-primary"] > button {{
-            font-size: 0.75rem !important;
-            letter-spacing: 0px !important;
-            padding: 0.6rem 0.8rem !important;
-            text-transform: none !important;
-        }}
-        
-        .bucolin-brand {{
-            font-size: 1rem !important;
-            letter-spacing: 2px !important;
-            margin-bottom: 0.5rem !important;
-        }}
-        
-        .nav-container {{
-            padding: 0.8rem 1rem !important;
-        }}
-    }}
+NAV_PAGES = {
+    "demo": "Demo",
+    "about": "About",
+    "research": "Research",
+    "team": "Team"
+}
+NAV_KEYS = tuple(NAV_PAGES)
 
-    @media (max-width: 576px) {{
-        /* Hide decorative icon on very small screens */
-        [data-testid="column"]:first-child {{
-            display: none !important;
-        }}
-        
-        .stButton > button,
-        .stButton[data-testid="baseButton-secondary"] > button,
-        .stButton[data-testid="baseButton-primary"] > button {{
-            font-size: 0.7rem !important;
-            padding: 0.5rem 0.6rem !important;
-        }}
-        
-        .stLinkButton > a {{
-            font-size: 0.7rem !important;
-            padding: 0.5rem 0.6rem !important;
-        }}
-    }}
+def _set_page():
+    """Radio callback: record the selected page in the URL before the rerun routes to it"""
+    st.query_params.page = st.session_state.nav_radio
 
-    </style>
-    """, unsafe_allow_html=True)
-
-def theme_toggle():
-    """Render theme toggle button"""
-    current_theme = st.session_state.get('theme', 'light')
-    
-    # Create columns for the theme toggle in the navigation
-    col1, col2, col3 = st.columns([4, 1, 1])
-    
-    with col3:
-        if current_theme == 'dark':
-            if st.button("☀️ Light", key="theme_btn", use_container_width=True):
-                st.session_state.theme = 'light'
-                st.rerun()
-        else:
-            if st.button("🌙 Dark", key="theme_btn", use_container_width=True):
-                st.session_state.theme = 'dark'
-                st.rerun()
-
-def navigation_menu():
+def navigation_menu(query_params):
     """Render navigation menu and handle routing"""
-    apply_custom_styles()
+    # Session state is read once here and shared by the styles and the theme button
+    theme = st.session_state.get('theme', 'light')
+    apply_custom_styles(theme)
     
-    # Get current page from query params
-    query_params = st.query_params
+    # Current page comes from the query params main() already read
     current_page = query_params.get("page", "demo")
     
-    st.markdown('''
-    <div class="nav-container">
-        <div class="bucolin-brand">BUCOLIN</div>
-    </div>
-    ''', unsafe_allow_html=True)
+    st.html(NAV_BRAND_HTML)
     
-    # Navigation buttons with small decorative icon and theme toggle on the ends
-    col_left, col1, col2, col3, col4, col5, col_right = st.columns([0.6, 1, 1, 1, 1, 1, 0.6])
+    # Navigation with small decorative icon and theme toggle on the ends
+    col_left, col_nav, col5, col_right = st.columns([0.6, 4, 1, 0.6])
     
     # Small decorative element on the left (not a button)
     with col_left:
-        st.markdown(
-            '<div style="display: flex; align-items: center; justify-content: center; height: 38px; font-size: 1.2rem; opacity: 0.4;">📚</div>',
-            unsafe_allow_html=True
+        st.html(NAV_ICON_HTML)
+    
+    # One radio widget instead of four buttons: a selection is a single rerun.
+    # The URL is the source of truth: the widget is synced from it on every run and
+    # a selection only writes it back through the callback.
+    with col_nav:
+        if current_page not in NAV_PAGES:
+            current_page = "demo"
+        st.session_state.nav_radio = current_page
+        st.radio(
+            "Navigation",
+            NAV_KEYS,
+            format_func=NAV_PAGES.get,
+            horizontal=True,
+            label_visibility="collapsed",
+            key="nav_radio",
+            on_change=_set_page
         )
     
-    with col1:
-        if st.button("Demo", use_container_width=True, type="primary" if current_page == "demo" else "secondary"):
-            st.query_params.page = "demo"
-            st.rerun()
-    
-    with col2:
-        if st.button("About", use_container_width=True, type="primary" if current_page == "about" else "secondary"):
-            st.query_params.page = "about"
-            st.rerun()
-    
-    with col3:
-        if st.button("Research", use_container_width=True, type="primary" if current_page == "research" else "secondary"):
-            st.query_params.page = "research"
-            st.rerun()
-    
-    with col4:
-        if st.button("Team", use_container_width=True, type="primary" if current_page == "team" else "secondary"):
-            st.query_params.page = "team"
-            st.rerun()
-    
     with col5:
         st.link_button("🤗 HuggingFace", PublicConfig.HUGGINGFACE_URL, use_container_width=True)
     
-    # Small theme toggle button on the right
+    # Small theme toggle button on the right; the callback runs before the rerun,
+    # so the new theme's CSS is applied without a second forced rerun
     with col_right:
-        current_theme = st.session_state.get('theme', 'light')
-        if current_theme == 'dark':
-            if st.button("☀️", use_container_width=True, key="theme_btn", help="Switch to Light Mode"):
-                st.session_state.theme = 'light'
-                st.rerun()
-        else:
-            if st.button("🌙", use_container_width=True, key="theme_btn", help="Switch to Dark Mode"):
-                st.session_state.theme = 'dark'
-                st.rerun()
-    
-    st.markdown('</div>', unsafe_allow_html=True)
+        icon, help_text, next_theme = _THEME_SWITCH[theme]
+        st.button(icon, use_container_width=True, key="theme_btn", help=help_text, on_click=_set_theme, args=(next_theme,))
     
     return current_page
 
-def main_app():
-    """Main translation application interface"""
-    
-    # Header
-    st.markdown(f"""
-    <div class="main-header">
-        <div style="position: relative; z-index: 1;">
-            <h1 style="margin: 0; font-size: 2.8rem; font-weight: 700; font-family: 'Crimson Text', serif;">
-                HISTORICAL TURKISH TRANSLATOR
-            </h1>
-            <div style="display: flex; justify-content: center; align-items: center; gap: 1rem; margin-top: 1rem;">
-                <span style="color: var(--text-secondary); font-weight: 600; font-size: 1rem; font-family: 'Inter', sans-serif;">
-                    {PublicConfig.DEFAULT_LANGUAGE_PAIR[0].replace('_', ' ').title()}
-                </span>
-                <div style="display: flex; align-items: center; gap: 0.5rem;">
-                    <div style="width: 8px; height: 1px; background: var(--accent-primary);"></div>
-                    <span style="color: var(--accent-primary); font-size: 1.2rem; font-weight: 700;">⟷</span>
-                    <div style="width: 8px; height: 1px; background: var(--accent-primary);"></div>
-                </div>
-                <span style="color: var(--text-secondary); font-weight: 600; font-size: 1rem; font-family: 'Inter', sans-serif;">
-                    {PublicConfig.DEFAULT_LANGUAGE_PAIR[1].replace('_', ' ').title()}
-                </span>
-            </div>
-            <div style="display: flex; justify-content: center; align-items: center; gap: 2rem; margin-top: 1.5rem; font-size: 0.85rem;">
-                <div style="display: flex; align-items: center; gap: 0.5rem;">
-                    <span style="color: var(--accent-secondary);">🚀</span>
-                    <span style="color: var(--text-muted); font-weight: 500;">v{PublicConfig.APP_VERSION}</span>
-                </div>
-                <div style="display: flex; align-items: center; gap: 0.5rem;">
-                    <span style="color: var(--accent-primary);">🎓</span>
-                    <span style="color: var(--text-muted); font-weight: 500;">Research Preview</span>
-                </div>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+# (upper bound, emoji, label) buckets for the words-processed card
+_WORD_COUNT_BUCKETS = [
+    (50, "📊", "Short Text"),
+    (200, "📈", "Medium Text"),
+    (float('inf'), "📋", "Long Text")
+]
+
+# (emoji, value color, environment label) for the engine card
+_MOCK_SERVICE_STYLE = ("🔧", "var(--accent-tertiary)", "Development")
+_API_SERVICE_STYLE = ("🚀", "var(--accent-secondary)", "Production")
+
+# (exclusive lower bound, emoji, value color, label) buckets for the confidence card
+_CONFIDENCE_BUCKETS = [
+    (0.8, "🟢", "var(--accent-secondary)", "Excellent"),
+    (0.6, "🟡", "var(--accent-primary)", "Good"),
+    (float('-inf'), "🔴", "var(--accent-tertiary)", "Fair")
+]
+
+# (upper bound in seconds, emoji, label) buckets for the processing-time card
+_PROCESSING_TIME_BUCKETS = [
+    (1, "⚡", "Lightning Fast"),
+    (3, "⏱️", "Standard"),
+    (float('inf'), "🐌", "Processing")
+]
+
+# One card per metric, keyed by prefix so the whole row is a single format() call
+_METRIC_CARD_TEMPLATE = (
+    '<div class="metric-card shimmer-overlay">'
+    '<div class="metric-label">{{{p}_label}}</div>'
+    '<div class="metric-value" style="{{{p}_style}}">{{{p}_value}}</div>'
+    '<div class="metric-caption">{{{p}_caption}}</div>'
+    '</div>'
+)
+# The analysis panel: title plus the four cards, wrapped in the .stats-grid panel
+_RESULTS_METRICS_TEMPLATE = (
+    '<div class="stats-grid">' + ANALYSIS_TITLE_HTML + '<div class="metric-grid">'
+    + "".join(_METRIC_CARD_TEMPLATE.format(p=p) for p in ("confidence", "time", "words", "engine"))
+    + '</div></div>'
+)
+_ADMIN_STATUS_TEMPLATE = (
+    '<div class="metric-grid metric-grid--3">'
+    + "".join(_METRIC_CARD_TEMPLATE.format(p=p) for p in ("mode", "status", "endpoint"))
+    + '</div>'
+)
+
+def _results_metrics_html(result: Dict[str, Any]) -> str:
+    """Render the analysis title and four result metric cards as one .stats-grid panel"""
+    confidence = result.get('confidence', 0)
+    confidence_emoji, confidence_color, confidence_label = next(
+        (e, c, l) for floor, e, c, l in _CONFIDENCE_BUCKETS if confidence > floor
+    )
     
-    translator = TurkishTranslator()
+    processing_time = result.get('processing_time', 0)
+    time_emoji, time_label = next((e, l) for limit, e, l in _PROCESSING_TIME_BUCKETS if processing_time < limit)
+    
+    word_count = result.get('word_count', 0)
+    word_emoji, word_label = next((e, l) for limit, e, l in _WORD_COUNT_BUCKETS if word_count < limit)
+    
+    service_used = result.get('service_used', 'Unknown')
+    service_display = service_used.split(' (')[0]  # Remove environment info for display
+    service_emoji, service_color, service_label = _MOCK_SERVICE_STYLE if "Mock" in service_used else _API_SERVICE_STYLE
+    
+    return _RESULTS_METRICS_TEMPLATE.format(
+        confidence_label=f"Confidence {confidence_emoji}",
+        confidence_style=f"color: {confidence_color};",
+        confidence_value=f"{confidence:.1%}",
+        confidence_caption=confidence_label,
+        time_label=f"Processing Time {time_emoji}",
+        time_style="",
+        time_value=f"{processing_time:.2f}s",
+        time_caption=time_label,
+        words_label=f"Words Processed {word_emoji}",
+        words_style="",
+        words_value=word_count,
+        words_caption=word_label,
+        engine_label=f"Engine Used {service_emoji}",
+        engine_style=f"font-size: 1.2rem; color: {service_color};",
+        engine_value=service_display,
+        engine_caption=service_label
+    )
+
+@st.cache_resource
+def _translation_executor() -> ThreadPoolExecutor:
+    """Worker pool for background translations, shared by all sessions and sized from config"""
+    return ThreadPoolExecutor(max_workers=PublicConfig.TRANSLATION_WORKERS, thread_name_prefix="translate")
+
+@st.fragment(run_every=0.25)
+def _await_translation():
+    """Poll the pending translation; once it lands, rerun the app so the result and stats render"""
+    future = st.session_state.translate_future
+    if future.done():
+        del st.session_state.translate_future
+        try:
+            result = future.result()
+        except Exception as e:
+            # Surface worker failures like any other failed translation, not as a traceback
+            result = {"success": False, "error": f"Translation failed: {e}"}
+        if result.get("success"):
+            st.session_state.translation_metrics_html = _results_metrics_html(result)
+        st.session_state.translation_result = result
+        st.session_state.has_translation = True
+        st.rerun()
     
+    st.status("🧠 Processing translation with AI...", state="running")
+
+@st.fragment
+def translator_panel():
+    """Input, output and analysis; a translate or toggle reruns only this fragment, not nav and styles"""
     # Main translation interface
     col1, col2 = st.columns([1, 1], gap="large")
     
     with col1:
-        st.markdown("""
-        <div class="translation-container">
-            <div class="section-header">Source Text</div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        input_text = st.text_area(
-            "Enter your historical Turkish text here...",
-            height=200,
-            placeholder=f"Type or paste your Old Turkish text here... (max {PublicConfig.MAX_TEXT_LENGTH} characters)",
-            label_visibility="collapsed",
-            key="input_text",
-            max_chars=PublicConfig.MAX_TEXT_LENGTH
-        )
+        st.html(SOURCE_HEADER_HTML)
         
-        # Character count
-        char_count = len(input_text) if input_text else 0
-        st.caption(f"Characters: {char_count}/{PublicConfig.MAX_TEXT_LENGTH}")
-        
-        # Translate button
-        translate_clicked = st.button(
-            "TRANSLATE", 
-            use_container_width=True,
-            help="Process translation using AI",
-            disabled=(char_count == 0 or char_count > PublicConfig.MAX_TEXT_LENGTH)
-        )
-        
-        if translate_clicked and input_text.strip():
-            # Create a beautiful loading animation
-            loading_placeholder = st.empty()
-            loading_placeholder.markdown("""
-            <div style="text-align: center; padding: 2rem;">
-                <div style="display: inline-block; width: 60px; height: 60px; border: 3px solid var(--border-primary); 
-                            border-radius: 50%; border-top: 3px solid var(--accent-primary); 
-                            animation: spin 1s linear infinite; margin-bottom: 1rem;"></div>
-                <p style="color: var(--text-secondary); font-family: 'Inter', sans-serif; font-weight: 500;">
-                    🧠 Processing translation with AI...
-                </p>
-                <style>
-                @keyframes spin {
-                    0% { transform: rotate(0deg); }
-                    100% { transform: rotate(360deg); }
-                }
-                </style>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Process translation
-            result = translator.translate_text(input_text)
-            st.session_state.translation_result = result
-            st.session_state.has_translation = True
+        # Input and button share a form so typing doesn't rerun the whole page
+        with st.form("translate_form", clear_on_submit=False):
+            input_text = st.text_area(
+                "Enter your historical Turkish text here...",
+                height=200,
+                placeholder=f"Type or paste your Old Turkish text here... (max {PublicConfig.MAX_TEXT_LENGTH} characters)",
+                label_visibility="collapsed",
+                key="input_text",
+                # Also gives a live client-side character counter, no rerun needed
+                max_chars=PublicConfig.MAX_TEXT_LENGTH
+            )
             
-            # Clear loading animation
-            loading_placeholder.empty()
-        elif translate_clicked:
+            # Translate button
+            translate_clicked = st.form_submit_button(
+                "TRANSLATE", 
+                use_container_width=True,
+                help="Process translation using AI"
+            )
+        
+        # Reject empty submits before any spinner or translator work
+        if translate_clicked and not input_text.strip():
             st.warning("⚠️ Please enter text to translate")
+        elif translate_clicked:
+            # Translate off the script thread so the page keeps responding while the model runs
+            st.session_state.translate_future = _translation_executor().submit(get_translator().translate_text, input_text)
+            st.session_state.has_translation = False
     
     with col2:
-        st.markdown("""
-        <div class="translation-container">
-            <div class="section-header">Modern Translation</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(TRANSLATION_HEADER_HTML)
         
-        if hasattr(st.session_state, 'has_translation') and st.session_state.has_translation:
+        if "translate_future" in st.session_state:
+            _await_translation()
+        elif st.session_state.get("has_translation"):
             result = st.session_state.translation_result
             
             if result.get("success"):
@@ -1020,660 +731,247 @@ def main_app():
                 )
                 
                 # Success indicator
-                st.markdown('<div class="success-message">✅ Translation completed successfully</div>', unsafe_allow_html=True)
+                st.html('<div class="success-message">✅ Translation completed successfully</div>')
                 
             else:
-                st.text_area(
-                    "Translation result:",
-                    value="Translation failed - please try again",
-                    height=200,
-                    disabled=True,
-                    label_visibility="collapsed"
-                )
-                st.markdown(f'<div class="error-message">❌ {result.get("error", "Translation failed")}</div>', unsafe_allow_html=True)
+                st.html(f'<div class="error-message">❌ {result.get("error", "Translation failed")}</div>')
         else:
-            st.text_area(
-                "Translation will appear here...",
-                value="",
-                height=200,
-                disabled=True,
-                label_visibility="collapsed",
-                placeholder="Your modern Turkish translation will appear here"
-            )
+            # Plain HTML stand-in; the output widget is only built once there is text to show
+            st.html(OUTPUT_PLACEHOLDER_HTML)
     
     # Statistics section
-    if hasattr(st.session_state, 'has_translation') and st.session_state.has_translation:
+    if st.session_state.get("has_translation"):
         result = st.session_state.translation_result
         
         if result.get("success"):
-            st.markdown('<div class="stats-grid">', unsafe_allow_html=True)
-            st.markdown("""
-            <h3 style="color: var(--accent-primary); margin-bottom: 2.5rem; text-align: center; 
-                       font-family: 'Crimson Text', serif; text-transform: uppercase; 
-                       letter-spacing: 3px; font-size: 1.6rem; font-weight: 700;">
-                ✨ Translation Analysis ✨
-            </h3>
-            """, unsafe_allow_html=True)
+            # Built once when the result landed; reruns (e.g. the analysis toggle) just re-emit it
+            st.html(st.session_state.translation_metrics_html)
             
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                confidence = result.get('confidence', 0)
-                if confidence > 0.8:
-                    confidence_emoji = "🟢"
-                    confidence_color = "var(--accent-secondary)"
-                    confidence_label = "Excellent"
-                elif confidence > 0.6:
-                    confidence_emoji = "🟡"  
-                    confidence_color = "var(--accent-primary)"
-                    confidence_label = "Good"
-                else:
-                    confidence_emoji = "🔴"
-                    confidence_color = "var(--accent-tertiary)"
-                    confidence_label = "Fair"
+            # Detailed analysis - a keyed toggle keeps its state across reruns and only builds the body while open
+            if st.toggle("Detailed Analysis", key="analysis_details"):
+                with st.container(border=True):
+                    col1, col2 = st.columns(2)
                     
-                st.markdown(f'''
-                <div class="metric-card">
-                    <div class="metric-label">Confidence {confidence_emoji}</div>
-                    <div class="metric-value" style="color: {confidence_color};">{confidence:.1%}</div>
-                    <div style="color: var(--text-muted); font-size: 0.75rem; margin-top: 0.5rem; 
-                               text-transform: uppercase; letter-spacing: 1px;">{confidence_label}</div>
-                </div>
-                ''', unsafe_allow_html=True)
-            
-            with col2:
-                processing_time = result.get('processing_time', 0)
-                time_emoji = "⚡" if processing_time < 1 else "🐌" if processing_time > 3 else "⏱️"
-                st.markdown(f'''
-                <div class="metric-card">
-                    <div class="metric-label">Processing Time {time_emoji}</div>
-                    <div class="metric-value">{processing_time:.2f}s</div>
-                    <div style="color: var(--text-muted); font-size: 0.75rem; margin-top: 0.5rem; 
-                               text-transform: uppercase; letter-spacing: 1px;">
-                        {"Lightning Fast" if processing_time < 1 else "Standard" if processing_time < 3 else "Processing"}
-                    </div>
-                </div>
-                ''', unsafe_allow_html=True)
-            
-            with col3:
-                word_count = result.get('word_count', 0)
-                word_emoji = "📊" if word_count < 50 else "📈" if word_count < 200 else "📋"
-                st.markdown(f'''
-                <div class="metric-card">
-                    <div class="metric-label">Words Processed {word_emoji}</div>
-                    <div class="metric-value">{word_count}</div>
-                    <div style="color: var(--text-muted); font-size: 0.75rem; margin-top: 0.5rem; 
-                               text-transform: uppercase; letter-spacing: 1px;">
-                        {"Short Text" if word_count < 50 else "Medium Text" if word_count < 200 else "Long Text"}
-                    </div>
-                </div>
-                ''', unsafe_allow_html=True)
-            
-            with col4:
-                service_used = result.get('service_used', 'Unknown')
-                service_display = service_used.split(' (')[0]  # Remove environment info for display
-                service_emoji = "🔧" if "Mock" in service_used else "🚀"
-                service_color = "var(--accent-tertiary)" if "Mock" in service_used else "var(--accent-secondary)"
-                st.markdown(f'''
-                <div class="metric-card">
-                    <div class="metric-label">Engine Used {service_emoji}</div>
-                    <div class="metric-value" style="font-size: 1.2rem; color: {service_color};">{service_display}</div>
-                    <div style="color: var(--text-muted); font-size: 0.75rem; margin-top: 0.5rem; 
-                               text-transform: uppercase; letter-spacing: 1px;">
-                        {"Development" if "Mock" in service_used else "Production"}
-                    </div>
-                </div>
-                ''', unsafe_allow_html=True)
-            
-            st.markdown('</div>', unsafe_allow_html=True)
-            
-            # Detailed analysis
-            with st.expander("Detailed Analysis"):
-                st.markdown('<div class="details-section">', unsafe_allow_html=True)
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.write("**Source Language:** Old Turkish (Ottoman)")
-                    st.write("**Target Language:** Modern Turkish")
-                    if "recognized_words" in result:
-                        recognition_rate = result["recognized_words"] / result["word_count"] if result["word_count"] > 0 else 0
-                        st.write(f"**Recognition Rate:** {recognition_rate:.1%}")
-                
-                with col2:
-                    st.write(f"**Source Length:** {len(result.get('original_text', ''))} characters")
-                    st.write(f"**Translation Length:** {len(result.get('translated_text', ''))} characters")
-                    st.write(f"**Service:** {result.get('service_used', 'Unknown')}")
-                
-                st.markdown('</div>', unsafe_allow_html=True)
+                    with col1:
+                        st.write("**Source Language:** Old Turkish (Ottoman)")
+                        st.write("**Target Language:** Modern Turkish")
+                        if "recognition_rate" in result:
+                            st.write(f"**Recognition Rate:** {result['recognition_rate']:.1%}")
+                    
+                    with col2:
+                        st.write(f"**Source Length:** {result.get('source_length', 0)} characters")
+                        st.write(f"**Translation Length:** {result.get('translation_length', 0)} characters")
+                        st.write(f"**Service:** {result.get('service_used', 'Unknown')}")
 
-def about_page():
-    """About page with project information"""
-    st.markdown("""
-    <div style="text-align: center; margin-bottom: 4rem;">
-        <h1 style="color: var(--accent-primary); font-family: 'Crimson Text', serif; font-size: 3rem; font-weight: 700; margin-bottom: 1rem;">Historical Turkish Translation</h1>
-        <p style="color: var(--text-secondary); font-size: 1.3rem; font-weight: 400; max-width: 600px; margin: 0 auto;">Bridging centuries of Turkish linguistic evolution with cutting-edge AI technology</p>
-        <div style="width: 80px; height: 3px; background: linear-gradient(90deg, var(--accent-primary), var(--accent-tertiary)); margin: 2rem auto; border-radius: 2px;"></div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    col1, col2 = st.columns([2, 1], gap="large")
-    
-    with col1:
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, var(--bg-tertiary) 0%, var(--bg-secondary) 100%); 
-                    padding: 2.5rem; border-radius: 16px; border: 1px solid var(--border-primary); 
-                    box-shadow: 0 12px 32px var(--shadow-md); margin-bottom: 2rem;">
-            <h2 style="color: var(--accent-primary); font-size: 1.8rem; margin-bottom: 1.5rem; font-family: 'Crimson Text', serif;">🌟 Project Overview</h2>
-            <p style="color: var(--text-secondary); line-height: 1.8; font-size: 1.1rem; margin-bottom: 1.5rem;">
-                This translation system represents a breakthrough in computational linguistics for historical Turkish texts. 
-                Developed by the BUCOLIN lab at Boğaziçi University, it enables seamless translation between Ottoman Turkish 
-                and Modern Turkish, making centuries of historical documents accessible to contemporary readers and researchers.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, var(--bg-tertiary) 0%, var(--bg-secondary) 100%); 
-                    padding: 2.5rem; border-radius: 16px; border: 1px solid var(--border-primary); 
-                    box-shadow: 0 12px 32px var(--shadow-md);">
-            <h3 style="color: var(--accent-tertiary); font-size: 1.5rem; margin-bottom: 1.5rem; font-family: 'Crimson Text', serif;">🚀 Key Features</h3>
-            <div style="display: grid; gap: 1rem;">
-                <div style="display: flex; align-items: center; padding: 0.8rem; background: var(--bg-primary); border-radius: 8px; border-left: 3px solid var(--accent-primary);">
-                    <span style="color: var(--accent-primary); font-size: 1.2rem; margin-right: 1rem;">🎯</span>
-                    <div>
-                        <strong style="color: var(--text-primary);">Historical Accuracy:</strong>
-                        <span style="color: var(--text-secondary); margin-left: 0.5rem;">Trained on authentic texts from 15th-20th centuries</span>
-                    </div>
-                </div>
-                <div style="display: flex; align-items: center; padding: 0.8rem; background: var(--bg-primary); border-radius: 8px; border-left: 3px solid var(--accent-tertiary);">
-                    <span style="color: var(--accent-tertiary); font-size: 1.2rem; margin-right: 1rem;">🔬</span>
-                    <div>
-                        <strong style="color: var(--text-primary);">Linguistic Precision:</strong>
-                        <span style="color: var(--text-secondary); margin-left: 0.5rem;">Preserves semantic meaning across temporal variations</span>
-                    </div>
-                </div>
-                <div style="display: flex; align-items: center; padding: 0.8rem; background: var(--bg-primary); border-radius: 8px; border-left: 3px solid var(--accent-secondary);">
-                    <span style="color: var(--accent-secondary); font-size: 1.2rem; margin-right: 1rem;">🎓</span>
-                    <div>
-                        <strong style="color: var(--text-primary);">Academic Grade:</strong>
-                        <span style="color: var(--text-secondary); margin-left: 0.5rem;">Suitable for scholarly research and educational purposes</span>
-                    </div>
-                </div>
-                <div style="display: flex; align-items: center; padding: 0.8rem; background: var(--bg-primary); border-radius: 8px; border-left: 3px solid var(--accent-primary);">
-                    <span style="color: var(--accent-primary); font-size: 1.2rem; margin-right: 1rem;">⚡</span>
-                    <div>
-                        <strong style="color: var(--text-primary);">Real-time Processing:</strong>
-                        <span style="color: var(--text-secondary); margin-left: 0.5rem;">Instant translation with confidence metrics</span>
-                    </div>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        # Get current theme to conditionally style cards
-        current_theme = st.session_state.get('theme', 'light')
-        
-        if current_theme == 'dark':
-            # Dark mode: Beautiful dark gradient with white text
-            tech_card_style = """background: linear-gradient(135deg, var(--accent-secondary) 0%, var(--accent-primary) 100%); 
-                        color: #ffffff; box-shadow: 0 16px 40px var(--overlay-tertiary-2xl);"""
-            tech_text_color = "#ffffff"
-        else:
-            # Light mode: Lighter blue gradient with dark text
-            tech_card_style = """background: linear-gradient(135deg, #d0e1f0 0%, #c2d7ed 100%); 
-                        color: #0a1929; box-shadow: 0 12px 32px var(--shadow-md); 
-                        border: 1px solid #b5cde6;"""
-            tech_text_color = "#1e3a5f"
-        
-        st.markdown(f"""
-        <div style="{tech_card_style} 
-                    padding: 2.5rem; border-radius: 16px; position: relative; overflow: hidden;">
-            <div style="position: absolute; top: -50%; right: -50%; width: 100%; height: 100%; 
-                        background: radial-gradient(circle, var(--overlay-white-sm) 0%, transparent 70%); 
-                        border-radius: 50%;"></div>
-            <h3 style="color: {tech_text_color}; font-size: 1.4rem; margin-bottom: 1.5rem; 
-                       font-family: 'Crimson Text', serif; position: relative; z-index: 1;">⚙️ Technical Specifications</h3>
-            <div style="position: relative; z-index: 1;">
-                <div style="margin-bottom: 1rem;">
-                    <strong>Model Type:</strong><br>
-                    <span style="opacity: 0.9;">Transformer-based</span>
-                </div>
-                <div style="margin-bottom: 1rem;">
-                    <strong>Training Data:</strong><br>
-                    <span style="opacity: 0.9;">Ottoman Text Corpus</span>
-                </div>
-                <div style="margin-bottom: 1rem;">
-                    <strong>Coverage:</strong><br>
-                    <span style="opacity: 0.9;">15th-20th centuries</span>
-                </div>
-                <div style="margin-bottom: 1rem;">
-                    <strong>Languages:</strong><br>
-                    <span style="opacity: 0.9;">{PublicConfig.DEFAULT_LANGUAGE_PAIR[0].replace('_', ' ').title()} ↔ {PublicConfig.DEFAULT_LANGUAGE_PAIR[1].replace('_', ' ').title()}</span>
-                </div>
-                <div style="margin-bottom: 1rem;">
-                    <strong>Version:</strong><br>
-                    <span style="opacity: 0.9;">{PublicConfig.APP_VERSION}</span>
-                </div>
-                <div style="margin-bottom: 0;">
-                    <strong>Max Text Length:</strong><br>
-                    <span style="opacity: 0.9;">{PublicConfig.MAX_TEXT_LENGTH:,} characters</span>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Enhanced Feature cards
-    st.markdown("---")
-    st.markdown("""
-    <h2 style="text-align: center; color: var(--accent-primary); font-family: 'Crimson Text', serif; 
-               font-size: 2.2rem; margin: 3rem 0 2rem 0;">✨ Core Capabilities</h2>
-    """, unsafe_allow_html=True)
-    
-    col1, col2, col3 = st.columns(3, gap="large")
-    
-    with col1:
-        st.markdown("""
-        <div style="text-align: center; padding: 2.5rem 2rem; 
-                    background: linear-gradient(135deg, var(--bg-tertiary) 0%, var(--bg-secondary) 100%);
-                    border-radius: 16px; border: 1px solid var(--border-primary);
-                    box-shadow: 0 12px 32px var(--shadow-md); 
-                    transition: all 0.4s ease; position: relative; overflow: hidden;"
-             onmouseover="this.style.transform='translateY(-8px) scale(1.02)'; this.style.boxShadow='0 20px 40px var(--overlay-primary-xl)';"
-             onmouseout="this.style.transform='translateY(0) scale(1)'; this.style.boxShadow='0 12px 32px var(--shadow-md)';">
-            <div style="font-size: 3.5rem; margin-bottom: 1.5rem; color: var(--accent-primary);">📜</div>
-            <h3 style="color: var(--accent-primary); margin-bottom: 1rem; font-family: 'Crimson Text', serif; font-size: 1.3rem;">Historical Texts</h3>
-            <p style="color: var(--text-secondary); line-height: 1.6;">Process manuscripts, documents, and literature from the Ottoman period with unprecedented accuracy and cultural sensitivity.</p>
-        </div>
-        """, unsafe_allow_html=True)
+def main_app():
+    """Main translation application interface"""
     
-    with col2:
-        st.markdown("""
-        <div style="text-align: center; padding: 2.5rem 2rem; 
-                    background: linear-gradient(135deg, var(--bg-tertiary) 0%, var(--bg-secondary) 100%);
-                    border-radius: 16px; border: 1px solid var(--border-primary);
-                    box-shadow: 0 12px 32px var(--shadow-md); 
-                    transition: all 0.4s ease; position: relative; overflow: hidden;"
-             onmouseover="this.style.transform='translateY(-8px) scale(1.02)'; this.style.boxShadow='0 20px 40px var(--overlay-secondary-xl)';"
-             onmouseout="this.style.transform='translateY(0) scale(1)'; this.style.boxShadow='0 12px 32px var(--shadow-md)';">
-            <div style="font-size: 3.5rem; margin-bottom: 1.5rem; color: var(--accent-tertiary);">🧠</div>
-            <h3 style="color: var(--accent-tertiary); margin-bottom: 1rem; font-family: 'Crimson Text', serif; font-size: 1.3rem;">AI-Powered</h3>
-            <p style="color: var(--text-secondary); line-height: 1.6;">Advanced neural networks specifically trained and fine-tuned for the nuances of historical Turkish language variations.</p>
-        </div>
-        """, unsafe_allow_html=True)
+    # Header
+    st.html(HEADER_HTML)
     
-    with col3:
-        st.markdown("""
-        <div style="text-align: center; padding: 2.5rem 2rem; 
-                    background: linear-gradient(135deg, var(--bg-tertiary) 0%, var(--bg-secondary) 100%);
-                    border-radius: 16px; border: 1px solid var(--border-primary);
-                    box-shadow: 0 12px 32px var(--shadow-md); 
-                    transition: all 0.4s ease; position: relative; overflow: hidden;"
-             onmouseover="this.style.transform='translateY(-8px) scale(1.02)'; this.style.boxShadow='0 20px 40px var(--overlay-tertiary-2xl)';"
-             onmouseout="this.style.transform='translateY(0) scale(1)'; this.style.boxShadow='0 12px 32px var(--shadow-md)';">
-            <div style="font-size: 3.5rem; margin-bottom: 1.5rem; color: var(--accent-secondary);">🎓</div>
-            <h3 style="color: var(--accent-secondary); margin-bottom: 1rem; font-family: 'Crimson Text', serif; font-size: 1.3rem;">Academic Research</h3>
-            <p style="color: var(--text-secondary); line-height: 1.6;">Developed by computational linguistics experts at Boğaziçi University with rigorous academic standards and peer review.</p>
-        </div>
-        """, unsafe_allow_html=True)
+    translator_panel()
 
-def research_page():
-    """Research page with academic information"""
-    st.markdown("""
-    <div style="text-align: center; margin-bottom: 4rem;">
-        <h1 style="color: var(--accent-primary); font-family: 'Crimson Text', serif; font-size: 3rem; font-weight: 700; margin-bottom: 1rem;">Research & Publications</h1>
-        <p style="color: var(--text-secondary); font-size: 1.3rem; font-weight: 400; max-width: 600px; margin: 0 auto;">Academic foundations and cutting-edge research in historical Turkish NLP</p>
-        <div style="width: 80px; height: 3px; background: linear-gradient(90deg, var(--accent-primary), var(--accent-tertiary)); margin: 2rem auto; border-radius: 2px;"></div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    col1, col2 = st.columns([2, 1], gap="large")
-    
-    with col1:
-        with st.container():
-            st.markdown("""
-            <div style="background: var(--bg-elevated); padding: 1.5rem; border-radius: 8px; border-left: 4px solid var(--accent-medium); margin: 1rem 0;">
-                <h3 style="color: var(--text-primary); margin-top: 0;">Translation Model Main Publication</h3>
-                <p style="color: var(--text-secondary); margin: 0.5rem 0;"><strong>Authors:</strong> BUCOLIN Research Team</p>
-                <p style="color: var(--text-secondary); margin: 0.5rem 0;"><strong>Institution:</strong> Boğaziçi University</p>
-                <p style="color: var(--text-secondary); margin: 0.5rem 0;"><strong>Status:</strong> <span style="color: var(--accent-hover);">Work in Progress</span></p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            if st.button("📄 Paper Coming Soon", disabled=True):
-                st.info("Paper will be available upon publication")
-        
-        with st.container():
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, var(--accent-secondary) 0%, var(--accent-muted) 100%); 
-                        padding: 2rem; border-radius: 12px; border-left: 4px solid var(--accent-primary); 
-                        margin: 1rem 0; box-shadow: 0 8px 24px var(--overlay-tertiary-2xl);">
-                <h3 style="color: #ffffff; margin-top: 0; font-size: 1.4rem; font-family: 'Crimson Text', serif; line-height: 1.3;">
-                    Building Foundations for Natural Language Processing of Historical Turkish: Resources and Models
-                </h3>
-                <div style="margin: 1.5rem 0;">
-                    <p style="color: #e8ecf1; margin: 0.5rem 0;"><strong>Authors:</strong> Şaziye Betül Özateş, Tarık Emre Tıraş, Ece Elif Adak, Berat Doğan, Fatih Burak Karagöz, Efe Eren Genç, Esma F. Bilgin Taşdemir</p>
-                    <p style="color: #e8ecf1; margin: 0.5rem 0;"><strong>Institution:</strong> Boğaziçi University</p>
-                    <p style="color: #e8ecf1; margin: 0.5rem 0;"><strong>Published:</strong> <span style="color: #ffffff;">January 8, 2025</span></p>
-                    <p style="color: #e8ecf1; margin: 0.5rem 0;"><strong>arXiv ID:</strong> <span style="color: #ffffff;">2501.04828</span></p>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            col_btn1, col_btn2 = st.columns(2)
-            with col_btn1:
-                st.link_button("📄 Read Paper", "https://arxiv.org/abs/2501.04828", use_container_width=True)
-            with col_btn2:
-                st.link_button("🤗 HuggingFace Resources", "https://huggingface.co/BUCOLIN", use_container_width=True)
-        
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, var(--bg-tertiary) 0%, var(--bg-secondary) 100%); 
-                    padding: 2.5rem; border-radius: 16px; border: 1px solid var(--border-primary); 
-                    box-shadow: 0 12px 32px var(--shadow-md); margin-top: 2rem;">
-            <h3 style="color: var(--accent-tertiary); font-size: 1.5rem; margin-bottom: 1.5rem; font-family: 'Crimson Text', serif;">📋 Abstract</h3>
-            <p style="color: var(--text-secondary); line-height: 1.8; font-size: 1.05rem;">
-                This paper introduces foundational resources and models for natural language processing of historical Turkish, 
-                a domain that has remained underexplored in computational linguistics. We present the first named entity recognition (NER) dataset, 
-                <strong>HisTR</strong> and the first Universal Dependencies treebank, <strong>OTA-BOUN</strong> for a historical form of the Turkish language 
-                along with transformer-based models trained using these datasets for named entity recognition, dependency parsing, and part-of-speech tagging tasks.
-            </p>
-            <p style="color: var(--text-secondary); line-height: 1.8; font-size: 1.05rem; margin-top: 1rem;">
-                Additionally, we introduce <strong>Ottoman Text Corpus (OTC)</strong>, a clean corpus of transliterated historical Turkish texts 
-                that spans a wide range of historical periods. Our experimental results show significant improvements in the computational analysis 
-                of historical Turkish, achieving promising results in tasks that require understanding of historical linguistic structures.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Placeholder for upcoming model paper
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, var(--bg-tertiary) 0%, var(--bg-secondary) 100%); 
-                    padding: 2.5rem; border-radius: 16px; border: 1px solid var(--border-primary); 
-                    box-shadow: 0 12px 32px var(--shadow-md); margin-top: 2rem; opacity: 0.8;
-                    border: 2px dashed var(--accent-primary);">
-            <h3 style="color: var(--accent-primary); font-size: 1.5rem; margin-bottom: 1.5rem; font-family: 'Crimson Text', serif;">🚀 Upcoming Publication</h3>
-            <p style="color: var(--text-secondary); line-height: 1.8; font-size: 1.05rem;">
-                <strong>Translation Model Paper</strong> - Additional research paper focusing on the translation models will be available soon.
-                This will provide detailed insights into the translation methodology and performance evaluation.
-            </p>
-            <p style="color: var(--text-muted); font-style: italic; margin-top: 1rem;">
-                Stay tuned for updates...
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+@st.cache_data(ttl=15, show_spinner=False)
+def _probe_api_health(endpoint: str) -> str:
+    """Ping the API health route; cached briefly so reruns don't block on it"""
+    import requests
+    
+    test_url = endpoint.replace('/translate', '/health')
+    try:
+        # Short connect/read timeouts keep an outage from stalling the admin page
+        response = requests.get(test_url, timeout=(0.3, 1.0))
+    except requests.exceptions.RequestException:
+        return "🔴 Offline"
+    return "🟢 Online" if response.ok else "🔴 Error"
+
+@st.cache_data(show_spinner=False)
+def _system_info_table(use_mock: bool, environment: str, api_endpoint: str) -> Dict[str, Dict[str, str]]:
+    """Setting -> value rows for the admin System Information table; rebuilt only when the config changes"""
+    return {"Value": {
+        "Application Version": PublicConfig.APP_VERSION,
+        "Service Mode": "Mock (Development)" if use_mock else "Production API",
+        "Environment": environment,
+        "API Endpoint": api_endpoint,
+        "Max Text Length": f"{max_len_display()} characters",
+        "Mock Processing Time": f"{PublicConfig.MOCK_PROCESSING_TIME}s"
+    }}
+
+class _ServiceTestError(Exception):
+    """Failed admin test; raised so st.cache_data never stores it, carries the error result"""
     
-    with col2:
-        # Get current theme to conditionally style cards
-        current_theme = st.session_state.get('theme', 'light')
-        
-        if current_theme == 'dark':
-            # Dark mode: Beautiful dark gradients with white text
-            research_card_style = """background: linear-gradient(135deg, var(--accent-secondary) 0%, var(--accent-primary) 100%); 
-                        color: #ffffff; box-shadow: 0 16px 40px var(--overlay-tertiary-2xl);"""
-            research_text_color = "#ffffff"
-            research_secondary_color = "#e8ecf1"
-            
-            dataset_card_style = """background: linear-gradient(135deg, var(--accent-tertiary) 0%, var(--accent-primary) 100%); 
-                        color: #ffffff; box-shadow: 0 16px 40px var(--overlay-secondary-xl);"""
-            dataset_text_color = "#ffffff"
-            dataset_secondary_color = "#e8ecf1"
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__(result.get("error", "Unknown error"))
+        self.result = result
+
+@st.cache_data(ttl=60, max_entries=128, show_spinner=False)
+def _test_translation(text: str) -> Dict[str, Any]:
+    """Admin test call straight to the service; successes are cached for 60s, failures raise and are retried"""
+    translator = get_translator()
+    key = text.strip()
+    result = translator.validate(key) or translator.service.translate(key)
+    result["service_used"] = translator.service_name
+    if not result.get("success"):
+        raise _ServiceTestError(result)
+    return result
+
+@st.fragment
+def _service_test_fragment():
+    """Service test form; reruns on its own so a test doesn't redraw the whole panel"""
+    test_text = st.text_input("Test Input", placeholder="Enter test text...")
+    
+    if st.button("🚀 Run Test", use_container_width=True):
+        if test_text:
+            # One status container that updates in place instead of spinner + separate result messages
+            with st.status("Testing service...", expanded=True) as status:
+                try:
+                    result = _test_translation(test_text)
+                except _ServiceTestError as e:
+                    result = e.result
+                
+                if result["success"]:
+                    st.code(f"Translation: {result.get('translated_text', 'N/A')}")
+                    st.caption(f"Response time: {result.get('processing_time', 0):.2f}s | Service: {result.get('service_used', 'Unknown')}")
+                    status.update(label="✅ Service operational", state="complete")
+                else:
+                    status.update(label=f"❌ Service error: {result.get('error', 'Unknown error')}", state="error")
         else:
-            # Light mode: Lighter blue gradients with dark text
-            research_card_style = """background: linear-gradient(135deg, #d4e3f0 0%, #c5d9ed 100%); 
-                        color: #0a1929; box-shadow: 0 12px 32px var(--shadow-md); 
-                        border: 1px solid #b8cfe6;"""
-            research_text_color = "#1e3a5f"
-            research_secondary_color = "#2d4f7a"
-            
-            dataset_card_style = """background: linear-gradient(135deg, #dde8f2 0%, #c9daf0 100%); 
-                        color: #0a1929; box-shadow: 0 12px 32px var(--shadow-md); 
-                        border: 1px solid #bdd2ea;"""
-            dataset_text_color = "#1e3a5f"
-            dataset_secondary_color = "#2d4f7a"
-        
-        st.markdown(f"""
-        <div style="{research_card_style} 
-                    padding: 2.5rem; border-radius: 16px; position: relative; overflow: hidden; margin-bottom: 2rem;">
-            <div style="position: absolute; top: -50%; right: -50%; width: 100%; height: 100%; 
-                        background: radial-gradient(circle, var(--overlay-white-sm) 0%, transparent 70%); 
-                        border-radius: 50%;"></div>
-            <h3 style="color: {research_text_color}; font-size: 1.4rem; margin-bottom: 1.5rem; 
-                       font-family: 'Crimson Text', serif; position: relative; z-index: 1;">🔬 Research Areas</h3>
-            <div style="position: relative; z-index: 1;">
-                <ul style="list-style: none; padding: 0; margin: 0; color: {research_secondary_color};">
-                    <li style="margin-bottom: 0.8rem; display: flex; align-items: center;">
-                        <span style="color: {research_text_color}; margin-right: 0.5rem;">📚</span>
-                        <span>Historical Text Processing</span>
-                    </li>
-                    <li style="margin-bottom: 0.8rem; display: flex; align-items: center;">
-                        <span style="color: {research_text_color}; margin-right: 0.5rem;">🔄</span>
-                        <span>Neural Machine Translation</span>
-                    </li>
-                    <li style="margin-bottom: 0.8rem; display: flex; align-items: center;">
-                        <span style="color: {research_text_color}; margin-right: 0.5rem;">🏷️</span>
-                        <span>Named Entity Recognition</span>
-                    </li>
-                    <li style="margin-bottom: 0.8rem; display: flex; align-items: center;">
-                        <span style="color: {research_text_color}; margin-right: 0.5rem;">🌳</span>
-                        <span>Dependency Parsing</span>
-                    </li>
-                    <li style="margin-bottom: 0.8rem; display: flex; align-items: center;">
-                        <span style="color: {research_text_color}; margin-right: 0.5rem;">📖</span>
-                        <span>Corpus Linguistics</span>
-                    </li>
-                    <li style="margin-bottom: 0; display: flex; align-items: center;">
-                        <span style="color: {research_text_color}; margin-right: 0.5rem;">🎯</span>
-                        <span>POS Tagging</span>
-                    </li>
-                </ul>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown(f"""
-        <div style="{dataset_card_style} 
-                    padding: 2.5rem; border-radius: 16px; position: relative; overflow: hidden;">
-            <div style="position: absolute; top: -50%; right: -50%; width: 100%; height: 100%; 
-                        background: radial-gradient(circle, var(--overlay-white-sm) 0%, transparent 70%); 
-                        border-radius: 50%;"></div>
-            <h3 style="color: {dataset_text_color}; font-size: 1.4rem; margin-bottom: 1.5rem; 
-                       font-family: 'Crimson Text', serif; position: relative; z-index: 1;">📊 Datasets & Resources</h3>
-            <div style="position: relative; z-index: 1;">
-                <div style="margin-bottom: 1.2rem;">
-                    <h4 style="color: {dataset_text_color}; margin: 0 0 0.5rem 0; font-size: 1.1rem;">HisTR</h4>
-                    <p style="margin: 0; font-size: 0.9rem; opacity: 0.9; color: {dataset_secondary_color};">First NER dataset for historical Turkish (812 sentences, 17th-19th centuries)</p>
-                </div>
-                <div style="margin-bottom: 1.2rem;">
-                    <h4 style="color: {dataset_text_color}; margin: 0 0 0.5rem 0; font-size: 1.1rem;">OTA-BOUN</h4>
-                    <p style="margin: 0; font-size: 0.9rem; opacity: 0.9; color: {dataset_secondary_color};">First UD treebank for historical Turkish (514 sentences)</p>
-                </div>
-                <div style="margin-bottom: 0;">
-                    <h4 style="color: {dataset_text_color}; margin: 0 0 0.5rem 0; font-size: 1.1rem;">OTC</h4>
-                    <p style="margin: 0; font-size: 0.9rem; opacity: 0.9; color: {dataset_secondary_color};">Ottoman Text Corpus (15th-20th centuries)</p>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
+            st.warning("Please enter test text")
 
-def team_page():
-    """Team page with lab information"""
-    st.markdown("""
-    <div style="text-align: center; margin-bottom: 3rem;">
-        <h1 style="color: var(--accent-hover); font-family: Georgia, serif; font-size: 2.5rem;">Research Team</h1>
-        <p style="color: var(--text-accent); font-size: 1.2rem;">BUCOLIN - Boğaziçi University Computational Linguistics Lab</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("## 🏛️ Laboratory")
-    
-    st.markdown("""
-    <div style="text-align: center; margin: 2rem 0;">
-        <p style="color: var(--text-bright); font-size: 1.1rem;">
-            <strong>Boğaziçi University Computational Linguistics Lab (BUCOLIN)</strong><br>
-            Department of Computer Engineering<br>
-            Boğaziçi University, İstanbul, Turkey
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.link_button("🏫 Boğaziçi University", PublicConfig.UNIVERSITY_URL, use_container_width=True)
+# Admin action key -> label; rendered as one segmented control rather than three buttons
+ADMIN_ACTIONS = {
+    "clear": "🔄 Clear Session",
+    "clear_cache": "🧹 Clear Translation Cache",
+    "info": "📊 System Info",
+    "sign_out": "🚪 Sign Out"
+}
+
+def _run_admin_action():
+    """Perform the selected admin action, then reset the control so it acts like a button"""
+    action = st.session_state.admin_action
+    st.session_state.admin_action = None
+    
+    if action == "clear":
+        # Clear translation results from session
+        st.session_state.pop('translation_result', None)
+        st.session_state.pop('has_translation', None)
+        st.session_state.pop('translate_future', None)
+        st.session_state.pop('translation_metrics_html', None)
+        st.session_state.admin_action_message = ("success", "Session cleared successfully")
+    elif action == "clear_cache":
+        # Process-wide: re-read config so rotated secrets take effect, and drop every user's cached translations
+        SecureConfig.invalidate()
+        get_translator().clear_cache()
+        _test_translation.clear()
+        st.session_state.admin_action_message = ("success", "Translation cache and config cleared for all users")
+    elif action == "info":
+        st.session_state.admin_action_message = ("info", "System information displayed above")
+    elif action == "sign_out":
+        st.session_state.admin_authenticated = False
+
+@st.fragment
+def _admin_actions_fragment():
+    """Admin action control, scoped to its own rerun"""
+    # Callbacks can't trigger a full rerun, so sign-out finishes here
+    if not st.session_state.get("admin_authenticated"):
+        st.rerun()
     
-    with col2:
-        st.link_button("🤗 BUCOLIN on HuggingFace", PublicConfig.HUGGINGFACE_URL, use_container_width=True)
+    st.markdown("### 🛠️ Admin Actions")
+    st.segmented_control(
+        "Admin Actions",
+        list(ADMIN_ACTIONS),
+        format_func=ADMIN_ACTIONS.get,
+        key="admin_action",
+        on_change=_run_admin_action,
+        label_visibility="collapsed"
+    )
     
-    st.markdown("### Research Focus")
-    st.markdown("""
-    Our lab specializes in developing computational methods for processing historical and contemporary Turkish texts. 
-    We work on machine translation, named entity recognition, dependency parsing, and corpus development 
-    to advance the field of Turkish computational linguistics.
-    """)
+    message = st.session_state.pop("admin_action_message", None)
+    if message:
+        kind, text = message
+        getattr(st, kind)(text)
 
 def admin_panel():
     """Secure admin panel - requires authentication"""
+    # Shared theme CSS so the status cards pick up the metric-card styling
+    apply_custom_styles()
+    
     # Apply security check
+    from admin import admin_required
     admin_required()
     
-    st.markdown(f"""
-    <div style="background: var(--accent-medium); padding: 2.5rem; border-radius: 8px; margin-bottom: 2rem; color: var(--text-bright); box-shadow: 0 6px 20px var(--overlay-tertiary-3xl); border: 2px solid var(--accent-secondary);">
-        <h1 style="color: var(--text-bright); font-weight: bold; margin: 0;">🔧 System Administration</h1>
-        <p style="color: var(--text-bright); margin: 0.5rem 0 0 0;">{PublicConfig.APP_NAME} - Control Panel</p>
-        <p style="color: var(--text-subtle); margin: 0.3rem 0 0 0; font-size: 0.9rem;">Environment: {'Development' if SecureConfig.is_development() else 'Production'}</p>
-    </div>
-    """, unsafe_allow_html=True)
+    # Read the environment-backed settings once per render
+    use_mock = SecureConfig.use_mock_service()
+    environment = "Development" if SecureConfig.is_development() else "Production"
+    api_endpoint = SecureConfig.get_api_endpoint()
     
-    # System Status Overview
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        service_type = "Mock Service" if SecureConfig.use_mock_service() else "Production API"
-        environment = "Development" if SecureConfig.is_development() else "Production"
-        st.markdown(f"""
-        <div style="background: var(--bg-surface); padding: 1.5rem; border-radius: 8px; border: 2px solid var(--border-secondary); text-align: center; color: var(--text-bright);">
-            <h3 style="color: var(--accent-hover); margin: 0.5rem 0;">Service Mode</h3>
-            <p style="font-size: 1.1rem; margin: 0.5rem 0;">{service_type}</p>
-            <p style="font-size: 0.9rem; color: var(--text-accent); margin: 0;">{environment}</p>
-        </div>
-        """, unsafe_allow_html=True)
+    st.html(ADMIN_HEADER_TEMPLATE.format(environment=environment))
     
-    with col2:
-        # Test API connectivity
-        if not SecureConfig.use_mock_service():
-            try:
-                test_url = SecureConfig.get_api_endpoint().replace('/translate', '/health')
-                response = requests.get(test_url, timeout=3)
-                status = "🟢 Online" if response.status_code == 200 else "🔴 Error"
-            except:
-                status = "🔴 Offline"
-        else:
-            status = "🟢 Active (Mock)"
-        
-        st.markdown(f"""
-        <div style="background: var(--bg-surface); padding: 1.5rem; border-radius: 8px; border: 2px solid var(--border-secondary); text-align: center; color: var(--text-bright);">
-            <h3 style="color: var(--accent-hover); margin: 0.5rem 0;">API Status</h3>
-            <p style="font-size: 1.1rem; margin: 0.5rem 0;">{status}</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        endpoint_display = SecureConfig.get_api_endpoint().split('/')[-2] if not SecureConfig.use_mock_service() else "localhost"
-        st.markdown(f"""
-        <div style="background: var(--bg-surface); padding: 1.5rem; border-radius: 8px; border: 2px solid var(--border-secondary); text-align: center; color: var(--text-bright);">
-            <h3 style="color: var(--accent-hover); margin: 0.5rem 0;">Endpoint</h3>
-            <p style="font-size: 1.1rem; margin: 0.5rem 0;">{endpoint_display}</p>
-        </div>
-        """, unsafe_allow_html=True)
+    # System Status Overview
+    service_type = "Mock Service" if use_mock else "Production API"
+    
+    # Test API connectivity (cached for a few seconds across reruns)
+    if st.button("🔄 Refresh Status", key="refresh_health"):
+        _probe_api_health.clear()
+    status = "🟢 Active (Mock)" if use_mock else _probe_api_health(api_endpoint)
+    
+    endpoint_display = "localhost" if use_mock else api_endpoint.rsplit('/', 2)[-2]
+    
+    st.html(
+        _ADMIN_STATUS_TEMPLATE.format(
+            mode_label="Service Mode",
+            mode_style="font-size: 1.2rem;",
+            mode_value=service_type,
+            mode_caption=environment,
+            status_label="API Status",
+            status_style="font-size: 1.2rem;",
+            status_value=status,
+            status_caption="",
+            endpoint_label="Endpoint",
+            endpoint_style="font-size: 1.2rem;",
+            endpoint_value=endpoint_display,
+            endpoint_caption=""
+        )
+    )
     
     st.markdown("---")
     
     # System Configuration
     col1, col2 = st.columns([1, 1])
     
-    with col1:
-        st.markdown("""
-        <div style="background: var(--bg-surface); padding: 2rem; border-radius: 8px; border: 2px solid var(--border-secondary);">
-            <h3 style="color: var(--accent-hover);">🔧 System Information</h3>
-        </div>
-        """, unsafe_allow_html=True)
+    with col1, st.container(border=True):
+        st.subheader("🔧 System Information")
         
-        st.write(f"**Application Version:** {PublicConfig.APP_VERSION}")
-        st.write(f"**Service Mode:** {'Mock (Development)' if SecureConfig.use_mock_service() else 'Production API'}")
-        st.write(f"**Environment:** {'Development' if SecureConfig.is_development() else 'Production'}")
-        st.write(f"**API Endpoint:** {SecureConfig.get_api_endpoint()}")
-        st.write(f"**Max Text Length:** {PublicConfig.MAX_TEXT_LENGTH:,} characters")
-        st.write(f"**Mock Processing Time:** {PublicConfig.MOCK_PROCESSING_TIME}s")
+        st.table(_system_info_table(use_mock, environment, api_endpoint))
     
-    with col2:
-        st.markdown("""
-        <div style="background: var(--bg-surface); padding: 2rem; border-radius: 8px; border: 2px solid var(--border-secondary);">
-            <h3 style="color: var(--accent-hover);">🧪 Service Testing</h3>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        test_text = st.text_input("Test Input", placeholder="Enter test text...")
-        
-        if st.button("🚀 Run Test", use_container_width=True):
-            if test_text:
-                translator = TurkishTranslator()
-                with st.spinner("Testing service..."):
-                    result = translator.translate_text(test_text)
-                
-                if result["success"]:
-                    st.success(f"✅ Service operational")
-                    st.code(f"Translation: {result.get('translated_text', 'N/A')}")
-                    st.caption(f"Response time: {result.get('processing_time', 0):.2f}s | Service: {result.get('service_used', 'Unknown')}")
-                else:
-                    st.error(f"❌ Service error: {result.get('error', 'Unknown error')}")
-            else:
-                st.warning("Please enter test text")
+    with col2, st.container(border=True):
+        st.subheader("🧪 Service Testing")
+        _service_test_fragment()
     
     # Admin Actions
-    st.markdown("### 🛠️ Admin Actions")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.button("🔄 Clear Session", use_container_width=True):
-            # Clear translation results from session
-            if 'translation_result' in st.session_state:
-                del st.session_state.translation_result
-            if 'has_translation' in st.session_state:
-                del st.session_state.has_translation
-            st.success("Session cleared successfully")
-    
-    with col2:
-        if st.button("📊 System Info", use_container_width=True):
-            st.info("System information displayed above")
-    
-    with col3:
-        if st.button("🚪 Sign Out", use_container_width=True):
-            st.session_state.admin_authenticated = False
-            st.rerun()
+    _admin_actions_fragment()
 
 def footer():
     """Simple, working footer"""
-    st.markdown(f"""
-    <div style="background: var(--bg-tertiary); padding: 2rem; border-radius: 12px; border-top: 3px solid var(--accent-primary); margin-top: 3rem; text-align: center; border: 1px solid var(--border-primary);">
-        <h3 style="color: var(--accent-primary); font-size: 1.5rem; margin: 0 0 1rem 0;">BUCOLIN</h3>
-        <p style="color: var(--text-secondary); margin: 0 0 1rem 0;">Boğaziçi University Computational Linguistics Lab</p>
-        <div style="width: 80px; height: 2px; background: var(--accent-primary); margin: 1rem auto;"></div>
-        <p style="color: var(--text-secondary); font-size: 0.9rem; margin: 0;">
-            {PublicConfig.APP_NAME} v{PublicConfig.APP_VERSION} • © 2025 BUCOLIN Lab
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(FOOTER_HTML)
+
+PAGE_CONFIG = {
+    "page_title": PublicConfig.APP_NAME,
+    "page_icon": "📜",
+    "layout": "wide",
+    "initial_sidebar_state": "collapsed"
+}
+
+# Info page key (see NAV_PAGES) -> module exposing render(); anything else is the demo
+PAGE_MODULES = {
+    "about": "about",
+    "research": "research",
+    "team": "team"
+}
 
 def main():
     """Main application entry point"""
-    st.set_page_config(
-        page_title=PublicConfig.APP_NAME,
-        page_icon="📜",
-        layout="wide",
-        initial_sidebar_state="collapsed"
-    )
+    # Must run on every script run: each rerun and each new session needs the page config
+    st.set_page_config(**PAGE_CONFIG)
     
     # Initialize theme in session state if not present - DEFAULT TO LIGHT NOW!
     if 'theme' not in st.session_state:
@@ -1682,21 +980,17 @@ def main():
     # Check URL parameters for admin access
     query_params = st.query_params
     
-    # Admin panel routing (secure)
+    # Admin panel routing (secure) - checked on every run rather than latched in
+    # session_state, since the same session can leave ?admin for the public pages
     if "admin" in query_params:
         admin_panel()
         return
     
-    # Regular page routing
-    current_page = navigation_menu()
-    
-    if current_page == "about":
-        about_page()
-    elif current_page == "research":
-        research_page()
-    elif current_page == "team":
-        team_page()
-    else:  # default to demo
+    # Regular page routing - only the selected page's module is imported and rendered
+    current_page = navigation_menu(query_params)
+    if current_page in PAGE_MODULES:
+        importlib.import_module(PAGE_MODULES[current_page]).render()
+    else:
         main_app()
     
     # Footer on all pages except admin
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import Optional
 import streamlit as st
 
@@ -28,9 +29,17 @@ class PublicConfig:
     # UI Configuration
     DEFAULT_LANGUAGE_PAIR = ("ottoman_turkish", "modern_turkish")
     MAX_TEXT_LENGTH = 5000
+    TRANSLATION_CACHE_SIZE = 512
+    TRANSLATION_CACHE_TTL = 3600  # seconds before a cached translation is fetched again
+    TRANSLATION_WORKERS = 16  # background translations in flight at once, across all sessions
+    
+    # API Service Settings
+    API_CHUNK_THRESHOLD = 1000
+    API_MAX_WORKERS = 4
     
     # Mock Service Settings (for demo)
     MOCK_PROCESSING_TIME = 0.8
+    MOCK_SIMULATE_LATENCY = not os.getenv("BUCOLIN_FAST_MOCK")  # export BUCOLIN_FAST_MOCK=1 to skip the artificial delay (tests, CI)
     MOCK_CONFIDENCE_THRESHOLD = 0.7
     
     # External Links (safe to be public)
@@ -40,26 +49,43 @@ class PublicConfig:
 class SecureConfig:
     """Secure configuration - load from environment variables or Streamlit secrets"""
     
+    # Every accessor is read once per process (a missing required value is not
+    # cached); call invalidate() to pick up changed secrets without a restart
+    @staticmethod
+    def invalidate() -> None:
+        SecureConfig.get_api_endpoint.cache_clear()
+        SecureConfig.use_mock_service.cache_clear()
+        SecureConfig.get_admin_password.cache_clear()
+        SecureConfig.get_api_key.cache_clear()
+        SecureConfig.is_development.cache_clear()
+        SecureConfig.get_secret_key.cache_clear()
+    
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_api_endpoint() -> str:
         return get_config("TRANSLATION_API_URL", "http://localhost:8000/translate")
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def use_mock_service() -> bool:
         return get_config("USE_MOCK_SERVICE", "true").lower() == "true"
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_admin_password() -> str:
         return get_config("ADMIN_PASSWORD")  # Required, no default
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_api_key() -> str:
         return get_config("API_KEY", None)
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def is_development() -> bool:
         return get_config("ENVIRONMENT", "development") == "development"
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_secret_key() -> str:
         return get_config("SECRET_KEY", "dev-key-change-in-production")
\ No newline at end of file
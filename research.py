@@ -0,0 +1,147 @@
+import streamlit as st
+from templates import minify_html
+
+RESEARCH_HEADER_HTML = minify_html("""
+<div class="page-hero">
+    <h1>Research & Publications</h1>
+    <p>Academic foundations and cutting-edge research in historical Turkish NLP</p>
+    <div class="page-hero__rule"></div>
+</div>
+""")
+
+RESEARCH_WIP_PUBLICATION_HTML = minify_html("""
+<div class="publication-card">
+    <h3>Translation Model Main Publication</h3>
+    <p><strong>Authors:</strong> BUCOLIN Research Team</p>
+    <p><strong>Institution:</strong> Boğaziçi University</p>
+    <p><strong>Status:</strong> <span class="publication-card__status">Work in Progress</span></p>
+</div>
+""")
+
+RESEARCH_FOUNDATIONS_PUBLICATION_HTML = minify_html("""
+<div class="publication-card publication-card--featured">
+    <h3>
+        Building Foundations for Natural Language Processing of Historical Turkish: Resources and Models
+    </h3>
+    <div class="publication-card__meta">
+        <p><strong>Authors:</strong> Şaziye Betül Özateş, Tarık Emre Tıraş, Ece Elif Adak, Berat Doğan, Fatih Burak Karagöz, Efe Eren Genç, Esma F. Bilgin Taşdemir</p>
+        <p><strong>Institution:</strong> Boğaziçi University</p>
+        <p><strong>Published:</strong> <span>January 8, 2025</span></p>
+        <p><strong>arXiv ID:</strong> <span>2501.04828</span></p>
+    </div>
+</div>
+""")
+
+RESEARCH_ABSTRACT_HTML = minify_html("""
+<div class="card-panel card-panel--spaced">
+    <h3 class="card-panel__title">📋 Abstract</h3>
+    <p class="card-panel__text">
+        This paper introduces foundational resources and models for natural language processing of historical Turkish, 
+        a domain that has remained underexplored in computational linguistics. We present the first named entity recognition (NER) dataset, 
+        <strong>HisTR</strong> and the first Universal Dependencies treebank, <strong>OTA-BOUN</strong> for a historical form of the Turkish language 
+        along with transformer-based models trained using these datasets for named entity recognition, dependency parsing, and part-of-speech tagging tasks.
+    </p>
+    <p class="card-panel__text">
+        Additionally, we introduce <strong>Ottoman Text Corpus (OTC)</strong>, a clean corpus of transliterated historical Turkish texts 
+        that spans a wide range of historical periods. Our experimental results show significant improvements in the computational analysis 
+        of historical Turkish, achieving promising results in tasks that require understanding of historical linguistic structures.
+    </p>
+</div>
+""")
+
+RESEARCH_UPCOMING_HTML = minify_html("""
+<div class="card-panel card-panel--spaced card-panel--upcoming">
+    <h3 class="card-panel__title card-panel__title--primary">🚀 Upcoming Publication</h3>
+    <p class="card-panel__text">
+        <strong>Translation Model Paper</strong> - Additional research paper focusing on the translation models will be available soon.
+        This will provide detailed insights into the translation methodology and performance evaluation.
+    </p>
+    <p class="card-panel__note">
+        Stay tuned for updates...
+    </p>
+</div>
+""")
+
+RESEARCH_AREAS_HTML = minify_html("""
+<div class="gradient-swatch gradient-swatch--areas" style="margin-bottom: 2rem;">
+    <h3>🔬 Research Areas</h3>
+    <div>
+        <ul class="swatch-list">
+            <li>
+                <span>📚</span>
+                <span>Historical Text Processing</span>
+            </li>
+            <li>
+                <span>🔄</span>
+                <span>Neural Machine Translation</span>
+            </li>
+            <li>
+                <span>🏷️</span>
+                <span>Named Entity Recognition</span>
+            </li>
+            <li>
+                <span>🌳</span>
+                <span>Dependency Parsing</span>
+            </li>
+            <li>
+                <span>📖</span>
+                <span>Corpus Linguistics</span>
+            </li>
+            <li>
+                <span>🎯</span>
+                <span>POS Tagging</span>
+            </li>
+        </ul>
+    </div>
+</div>
+""")
+
+DATASETS_HTML = minify_html("""
+<div class="gradient-swatch gradient-swatch--datasets">
+    <h3>📊 Datasets & Resources</h3>
+    <div>
+        <div class="dataset-item">
+            <h4>HisTR</h4>
+            <p>First NER dataset for historical Turkish (812 sentences, 17th-19th centuries)</p>
+        </div>
+        <div class="dataset-item">
+            <h4>OTA-BOUN</h4>
+            <p>First UD treebank for historical Turkish (514 sentences)</p>
+        </div>
+        <div class="dataset-item">
+            <h4>OTC</h4>
+            <p>Ottoman Text Corpus (15th-20th centuries)</p>
+        </div>
+    </div>
+</div>
+""")
+
+def render():
+    """Research page with academic information"""
+    st.html(RESEARCH_HEADER_HTML)
+    
+    st.html(RESEARCH_WIP_PUBLICATION_HTML)
+    
+    if st.button("📄 Paper Coming Soon", disabled=True):
+        st.info("Paper will be available upon publication")
+    
+    st.html(RESEARCH_FOUNDATIONS_PUBLICATION_HTML)
+    
+    col_btn1, col_btn2 = st.columns(2)
+    with col_btn1:
+        st.link_button("📄 Read Paper", "https://arxiv.org/abs/2501.04828", use_container_width=True)
+    with col_btn2:
+        st.link_button("🤗 HuggingFace Resources", "https://huggingface.co/BUCOLIN", use_container_width=True)
+    
+    # Abstract, research areas and datasets are only built once the reader opens them
+    if not st.toggle("Show abstract, research areas & datasets", key="research_details"):
+        return
+    
+    col1, col2 = st.columns([2, 1], gap="large")
+    
+    with col1:
+        # Abstract plus placeholder for upcoming model paper
+        st.html(RESEARCH_ABSTRACT_HTML + RESEARCH_UPCOMING_HTML)
+    
+    with col2:
+        st.html(RESEARCH_AREAS_HTML + DATASETS_HTML)
@@ -0,0 +1,43 @@
+import streamlit as st
+from config import PublicConfig
+from templates import minify_html
+
+TEAM_HEADER_HTML = minify_html("""
+<div style="text-align: center; margin-bottom: 3rem;">
+    <h1 style="color: var(--accent-hover); font-family: Georgia, serif; font-size: 2.5rem;">Research Team</h1>
+    <p style="color: var(--text-accent); font-size: 1.2rem;">BUCOLIN - Boğaziçi University Computational Linguistics Lab</p>
+</div>
+""")
+
+TEAM_LAB_HTML = minify_html("""
+<div style="text-align: center; margin: 2rem 0;">
+    <p style="color: var(--text-bright); font-size: 1.1rem;">
+        <strong>Boğaziçi University Computational Linguistics Lab (BUCOLIN)</strong><br>
+        Department of Computer Engineering<br>
+        Boğaziçi University, İstanbul, Turkey
+    </p>
+</div>
+""")
+
+def render():
+    """Team page with lab information"""
+    st.html(TEAM_HEADER_HTML)
+    
+    st.markdown("## 🏛️ Laboratory")
+    
+    st.html(TEAM_LAB_HTML)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.link_button("🏫 Boğaziçi University", PublicConfig.UNIVERSITY_URL, use_container_width=True)
+    
+    with col2:
+        st.link_button("🤗 BUCOLIN on HuggingFace", PublicConfig.HUGGINGFACE_URL, use_container_width=True)
+    
+    st.markdown("### Research Focus")
+    st.markdown("""
+    Our lab specializes in developing computational methods for processing historical and contemporary Turkish texts. 
+    We work on machine translation, named entity recognition, dependency parsing, and corpus development 
+    to advance the field of Turkish computational linguistics.
+    """)
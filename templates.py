@@ -0,0 +1,109 @@
+# Shared page HTML, built once at import instead of on every rerun of app.py
+import re
+from functools import lru_cache
+from typing import Tuple
+
+from config import PublicConfig
+
+_TAG_GAP = re.compile(r'>\s*\n\s*<')
+_WHITESPACE = re.compile(r'\s+')
+
+@lru_cache(maxsize=1)
+def pretty_lang_pair() -> Tuple[str, str]:
+    """Display names for the configured language pair"""
+    source, target = PublicConfig.DEFAULT_LANGUAGE_PAIR
+    return source.replace('_', ' ').title(), target.replace('_', ' ').title()
+
+@lru_cache(maxsize=1)
+def max_len_display() -> str:
+    """MAX_TEXT_LENGTH with thousands separators"""
+    return f"{PublicConfig.MAX_TEXT_LENGTH:,}"
+
+def minify_html(html: str) -> str:
+    """Collapse the indentation and line breaks of hand-written HTML"""
+    return _WHITESPACE.sub(' ', _TAG_GAP.sub('><', html)).strip()
+
+# Navigation bar brand and the decorative icon left of the page links
+NAV_BRAND_HTML = minify_html("""
+<div class="nav-container">
+    <div class="bucolin-brand">BUCOLIN</div>
+</div>
+""")
+
+NAV_ICON_HTML = '<div style="display: flex; align-items: center; justify-content: center; height: 38px; font-size: 1.2rem; opacity: 0.4;">📚</div>'
+
+# Static HTML for the demo page, built once at import
+HEADER_HTML = minify_html(f"""
+<div class="main-header">
+    <div style="position: relative; z-index: 1;">
+        <h1 style="margin: 0; font-size: 2.8rem; font-weight: 700; font-family: 'Crimson Text', serif;">
+            HISTORICAL TURKISH TRANSLATOR
+        </h1>
+        <div style="display: flex; justify-content: center; align-items: center; gap: 1rem; margin-top: 1rem;">
+            <span style="color: var(--text-secondary); font-weight: 600; font-size: 1rem; font-family: 'Inter', sans-serif;">
+                {pretty_lang_pair()[0]}
+            </span>
+            <div style="display: flex; align-items: center; gap: 0.5rem;">
+                <div style="width: 8px; height: 1px; background: var(--accent-primary);"></div>
+                <span style="color: var(--accent-primary); font-size: 1.2rem; font-weight: 700;">⟷</span>
+                <div style="width: 8px; height: 1px; background: var(--accent-primary);"></div>
+            </div>
+            <span style="color: var(--text-secondary); font-weight: 600; font-size: 1rem; font-family: 'Inter', sans-serif;">
+                {pretty_lang_pair()[1]}
+            </span>
+        </div>
+        <div style="display: flex; justify-content: center; align-items: center; gap: 2rem; margin-top: 1.5rem; font-size: 0.85rem;">
+            <div style="display: flex; align-items: center; gap: 0.5rem;">
+                <span style="color: var(--accent-secondary);">🚀</span>
+                <span style="color: var(--text-muted); font-weight: 500;">v{PublicConfig.APP_VERSION}</span>
+            </div>
+            <div style="display: flex; align-items: center; gap: 0.5rem;">
+                <span style="color: var(--accent-primary);">🎓</span>
+                <span style="color: var(--text-muted); font-weight: 500;">Research Preview</span>
+            </div>
+        </div>
+    </div>
+</div>
+""")
+
+SOURCE_HEADER_HTML = minify_html("""
+<div class="translation-container">
+    <div class="section-header">Source Text</div>
+</div>
+""")
+
+TRANSLATION_HEADER_HTML = minify_html("""
+<div class="translation-container">
+    <div class="section-header">Modern Translation</div>
+</div>
+""")
+
+ANALYSIS_TITLE_HTML = minify_html("""
+<h3 style="color: var(--accent-primary); margin-bottom: 2.5rem; text-align: center; 
+           font-family: 'Crimson Text', serif; text-transform: uppercase; 
+           letter-spacing: 3px; font-size: 1.6rem; font-weight: 700;">
+    ✨ Translation Analysis ✨
+</h3>
+""")
+
+OUTPUT_PLACEHOLDER_HTML = '<div class="output-placeholder">Your modern Turkish translation will appear here</div>'
+
+# Admin panel header; only the environment label is filled in per render
+ADMIN_HEADER_TEMPLATE = minify_html(f"""
+<div class="admin-header">
+    <h1>🔧 System Administration</h1>
+    <p>{PublicConfig.APP_NAME} - Control Panel</p>
+    <p class="admin-header__env">Environment: {{environment}}</p>
+</div>
+""")
+
+FOOTER_HTML = minify_html(f"""
+<div class="site-footer">
+    <h3>BUCOLIN</h3>
+    <p>Boğaziçi University Computational Linguistics Lab</p>
+    <div class="site-footer__rule"></div>
+    <p class="site-footer__meta">
+        {PublicConfig.APP_NAME} v{PublicConfig.APP_VERSION} • © 2025 BUCOLIN Lab
+    </p>
+</div>
+""")